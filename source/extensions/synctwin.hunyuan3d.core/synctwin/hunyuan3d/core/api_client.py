@@ -15,13 +15,29 @@ A Python client for the Hunyuan3D 2.1 API server that provides endpoints for gen
 """
 
 import base64
+import functools
 import json
+import random
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+# Base64 characters decoded per chunk when writing a model payload to disk
+# (multiple of 4 so every slice is a valid base64 quantum).
+_B64_DECODE_CHUNK = 4 * (1 << 20)
+
+# Bytes read per chunk when encoding an input image (multiple of 3 so each
+# chunk encodes without padding and the pieces concatenate cleanly).
+_B64_ENCODE_CHUNK = 3 * (1 << 20)
 
 
 class TaskStatus(str, Enum):
@@ -32,6 +48,13 @@ class TaskStatus(str, Enum):
     ERROR = "error"
 
 
+# Plain-string terminal statuses for the polling loop: the server sends raw
+# strings, so comparing against these skips the str-subclass enum dispatch
+# on every poll. TaskStatus stays the typed surface for external callers.
+_TERMINAL_OK = TaskStatus.COMPLETED.value
+_TERMINAL_ERR = TaskStatus.ERROR.value
+
+
 @dataclass
 class GenerationRequest:
     """Request model for 3D generation API."""
@@ -46,7 +69,18 @@ class GenerationRequest:
     face_count: int = 40000
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API request."""
+        """
+        Convert to dictionary for API request.
+
+        The dict is built once and cached: a request is treated as
+        immutable after it is handed to the client, so retries and batched
+        submissions reuse one dict instead of rebuilding a fresh one
+        referencing the multi-megabyte base64 image per call.
+        """
+        return self._request_dict
+
+    @functools.cached_property
+    def _request_dict(self) -> Dict[str, Any]:
         return {
             "image": self.image,
             "remove_background": self.remove_background,
@@ -60,15 +94,27 @@ class GenerationRequest:
         }
 
     @classmethod
-    def from_image_file(cls, image_path: str, **kwargs) -> 'GenerationRequest':
-        """Create a GenerationRequest from an image file."""
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
+    def from_image_file(cls, image_path: str, image_base64: Optional[str] = None, **kwargs) -> 'GenerationRequest':
+        """
+        Create a GenerationRequest from an image file.
 
-        # The server expects pure base64 data, not data URL format
-        base64_image = base64.b64encode(image_data).decode('utf-8')
+        Args:
+            image_path: Path to the input image file
+            image_base64: Pre-encoded base64 payload for the image; when
+                provided the file is not read or encoded again
+            **kwargs: Additional generation parameters
+        """
+        if image_base64 is None:
+            # The server expects pure base64 data, not data URL format.
+            # Encode in 3-byte-aligned chunks so the raw file contents and
+            # the full base64 form never coexist in memory.
+            encoded = bytearray()
+            with open(image_path, 'rb') as f:
+                while chunk := f.read(_B64_ENCODE_CHUNK):
+                    encoded += base64.b64encode(chunk)
+            image_base64 = encoded.decode('ascii')
 
-        return cls(image=base64_image, **kwargs)
+        return cls(image=image_base64, **kwargs)
 
 
 @dataclass
@@ -108,7 +154,22 @@ class HTTPValidationError:
 
 class Hunyuan3DAPIError(Exception):
     """Base exception for Hunyuan3D API errors."""
-    pass
+
+    #: Whether retrying the same call has a reasonable chance of succeeding.
+    is_retriable = False
+
+
+class Hunyuan3DAPITransientError(Hunyuan3DAPIError):
+    """
+    Exception for errors worth retrying.
+
+    Raised for connection failures, timeouts and 429/5xx responses, where
+    the request itself is sound and a later attempt may succeed. Terminal
+    errors (4xx, validation failures) stay on the base class so retry
+    layers can tell the two apart.
+    """
+
+    is_retriable = True
 
 
 class Hunyuan3DAPIValidationError(Hunyuan3DAPIError):
@@ -120,6 +181,30 @@ class Hunyuan3DAPIValidationError(Hunyuan3DAPIError):
         )
 
 
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables OS-level TCP keep-alive on pooled sockets.
+
+    Long-running pollers can sit idle between status checks; keep-alive
+    probes stop NAT boxes and load balancers from silently dropping the
+    connection, so the pool keeps reusing one socket instead of paying a
+    fresh handshake per poll.
+    """
+
+    _SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # Probe timing knobs are platform specific (Linux); add when present
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class Hunyuan3DAPIClient:
     """
     Client for the Hunyuan3D 2.1 API Server.
@@ -146,20 +231,63 @@ class Hunyuan3DAPIClient:
             'Accept': 'application/json'
         })
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        # Retry transient failures (connection blips, 429/502/503/504)
+        # with exponential backoff inside urllib3, so they never surface
+        # to callers as Hunyuan3DAPIError. Only idempotent GETs: replaying
+        # POST /send after an intermediary 5xx could duplicate a server
+        # task the submission dedup never sees. Connect-level errors still
+        # retry for POST, since the request never reached the server.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = _KeepAliveAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _remaining_timeout(self, deadline: Optional[float]) -> float:
+        """
+        Per-call timeout honoring an absolute deadline.
+
+        Returns self.timeout, capped so the call cannot outlive the deadline
+        (a time.monotonic() timestamp).
+
+        Raises:
+            Hunyuan3DAPIError: If the deadline has already passed
+        """
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Hunyuan3DAPIError("Deadline exceeded")
+        return min(self.timeout, remaining)
+
+    def _make_request(self, method: str, endpoint: str,
+                      deadline: Optional[float] = None, **kwargs) -> Dict[str, Any]:
         """
         Make an HTTP request to the API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
+            deadline: Optional absolute time.monotonic() deadline capping
+                this call's timeout
             **kwargs: Additional arguments for requests
 
         Returns:
             Response data as dictionary
 
         Raises:
-            Hunyuan3DAPIError: For API errors
+            Hunyuan3DAPIError: For API errors or an exceeded deadline
             Hunyuan3DAPIValidationError: For validation errors
         """
         url = f"{self.base_url}{endpoint}"
@@ -168,7 +296,7 @@ class Hunyuan3DAPIClient:
             response = self.session.request(
                 method=method,
                 url=url,
-                timeout=self.timeout,
+                timeout=self._remaining_timeout(deadline),
                 **kwargs
             )
             response.raise_for_status()
@@ -193,15 +321,26 @@ class Hunyuan3DAPIClient:
                     raise Hunyuan3DAPIError(
                         f"Validation error: {e.response.text}"
                     )
+            elif e.response.status_code == 429 or e.response.status_code >= 500:
+                raise Hunyuan3DAPITransientError(
+                    f"HTTP error {e.response.status_code}: {e.response.text}"
+                )
             else:
                 raise Hunyuan3DAPIError(
                     f"HTTP error {e.response.status_code}: {e.response.text}"
                 )
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
+            raise Hunyuan3DAPITransientError(f"Request failed: {str(e)}")
         except RequestException as e:
             raise Hunyuan3DAPIError(f"Request failed: {str(e)}")
         except json.JSONDecodeError as e:
             raise Hunyuan3DAPIError(f"Invalid JSON response: {str(e)}")
 
+    # Health probes should fail fast: a hung backend must not stall the
+    # caller for the full request timeout just to answer "is it up".
+    _HEALTH_TIMEOUT = 5.0
+
     def health_check(self) -> HealthResponse:
         """
         Check the health status of the Hunyuan3D API server.
@@ -212,37 +351,122 @@ class Hunyuan3DAPIClient:
         Raises:
             Hunyuan3DAPIError: If the health check fails
         """
-        data = self._make_request('GET', '/health')
+        data = self._make_request(
+            'GET', '/health',
+            deadline=time.monotonic() + self._HEALTH_TIMEOUT
+        )
         return HealthResponse(**data)
 
-    def generate_3d_model(self, request: GenerationRequest) -> bytes:
+    def generate_3d_model(self, request: GenerationRequest,
+                          out_path: Optional[str] = None,
+                          deadline: Optional[float] = None) -> Optional[bytes]:
         """
         Generate a 3D model from an input image synchronously.
 
-        This endpoint takes an image and generates a 3D model with optional textures.
-        The generation process includes background removal, mesh generation, and optional texture mapping.
+        Internally this submits the task with send_generation_task and polls
+        wait_for_completion with backoff, so the call is not limited by a
+        single HTTP read timeout the way the blocking /generate endpoint is;
+        realistic generation times work without inflating self.timeout.
+        Use _generate_blocking for the raw endpoint.
+
+        Args:
+            request: GenerationRequest containing the image and generation parameters
+            out_path: When given, the model is decoded chunk-wise straight
+                to this file and the decoded bytes are never held in full
+            deadline: Optional absolute time.monotonic() deadline covering
+                submission, polling and the final fetch
+
+        Returns:
+            bytes: The generated 3D model file (GLB or OBJ format), or None
+                when out_path was given
+
+        Raises:
+            Hunyuan3DAPIError: If the generation fails
+            Hunyuan3DAPIValidationError: If the request parameters are invalid
+        """
+        response = self.send_generation_task(request, deadline=deadline)
+        status_response = self.wait_for_completion(response.uid, deadline=deadline)
+        return self._decode_model(status_response, out_path)
+
+    def _decode_model(self, status_response: StatusResponse,
+                      out_path: Optional[str]) -> Optional[bytes]:
+        """
+        Decode the model payload of a completed task.
+
+        Detaches the base64 string from the response so it can be collected
+        promptly; with out_path set, decodes in aligned chunks straight to
+        the file and returns None.
+
+        Raises:
+            Hunyuan3DAPIError: If the response carries no model data or the
+                payload is not valid base64
+        """
+        model_base64 = status_response.model_base64
+        if not model_base64:
+            raise Hunyuan3DAPIError(
+                "No model data received from completed task"
+            )
+        # One upfront length check rejects a truncated payload before any
+        # chunk is decoded (or partially written to out_path).
+        if len(model_base64) % 4:
+            raise Hunyuan3DAPIError(
+                "Model payload is truncated (base64 length not a multiple of 4)"
+            )
+        status_response.model_base64 = None
+
+        if out_path is not None:
+            with open(out_path, 'wb') as f:
+                for start in range(0, len(model_base64), _B64_DECODE_CHUNK):
+                    f.write(base64.b64decode(
+                        model_base64[start:start + _B64_DECODE_CHUNK]
+                    ))
+            return None
+        return base64.b64decode(model_base64)
+
+    def _generate_blocking(self, request: GenerationRequest,
+                           out_path: Optional[str] = None,
+                           deadline: Optional[float] = None) -> Optional[bytes]:
+        """
+        Generate a 3D model via the blocking /generate endpoint.
+
+        This holds one HTTP connection open for the entire inference and is
+        bounded by a single request timeout, which realistic jobs exceed;
+        prefer generate_3d_model, which submits and polls instead.
 
         Args:
             request: GenerationRequest containing the image and generation parameters
+            out_path: When given, the model is streamed to this file in 1 MiB
+                chunks instead of being buffered in memory, bounding peak RSS
+                regardless of model size
+            deadline: Optional absolute time.monotonic() deadline capping
+                this call's timeout
 
         Returns:
-            bytes: The generated 3D model file (GLB or OBJ format)
+            bytes: The generated 3D model file (GLB or OBJ format), or None
+                when out_path was given
 
         Raises:
             Hunyuan3DAPIError: If the generation fails
             Hunyuan3DAPIValidationError: If the request parameters are invalid
         """
         url = f"{self.base_url}/generate"
+        timeout = self._remaining_timeout(deadline)
 
         try:
             response = self.session.post(
                 url,
                 json=request.to_dict(),
-                timeout=self.timeout
+                timeout=timeout,
+                stream=out_path is not None
             )
             response.raise_for_status()
 
             # The /generate endpoint returns the file directly
+            if out_path is not None:
+                with open(out_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                return None
             return response.content
 
         except requests.exceptions.HTTPError as e:
@@ -259,14 +483,22 @@ class Hunyuan3DAPIClient:
                     raise Hunyuan3DAPIError(
                         f"Validation error: {e.response.text}"
                     )
+            elif e.response.status_code == 429 or e.response.status_code >= 500:
+                raise Hunyuan3DAPITransientError(
+                    f"HTTP error {e.response.status_code}: {e.response.text}"
+                )
             else:
                 raise Hunyuan3DAPIError(
                     f"HTTP error {e.response.status_code}: {e.response.text}"
                 )
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
+            raise Hunyuan3DAPITransientError(f"Request failed: {str(e)}")
         except RequestException as e:
             raise Hunyuan3DAPIError(f"Request failed: {str(e)}")
 
-    def send_generation_task(self, request: GenerationRequest) -> GenerationResponse:
+    def send_generation_task(self, request: GenerationRequest,
+                             deadline: Optional[float] = None) -> GenerationResponse:
         """
         Send a 3D generation task to be processed asynchronously.
 
@@ -275,6 +507,8 @@ class Hunyuan3DAPIClient:
 
         Args:
             request: GenerationRequest containing the image and generation parameters
+            deadline: Optional absolute time.monotonic() deadline capping
+                this call's timeout
 
         Returns:
             GenerationResponse: Contains the unique task identifier
@@ -283,15 +517,19 @@ class Hunyuan3DAPIClient:
             Hunyuan3DAPIError: If the task submission fails
             Hunyuan3DAPIValidationError: If the request parameters are invalid
         """
-        data = self._make_request('POST', '/send', json=request.to_dict())
+        data = self._make_request('POST', '/send', json=request.to_dict(),
+                                  deadline=deadline)
         return GenerationResponse(**data)
 
-    def get_task_status(self, uid: str) -> StatusResponse:
+    def get_task_status(self, uid: str,
+                        deadline: Optional[float] = None) -> StatusResponse:
         """
         Check the status of a generation task.
 
         Args:
             uid: The unique identifier of the generation task
+            deadline: Optional absolute time.monotonic() deadline capping
+                this call's timeout
 
         Returns:
             StatusResponse: Current status of the task and result if completed
@@ -299,17 +537,28 @@ class Hunyuan3DAPIClient:
         Raises:
             Hunyuan3DAPIError: If the status check fails
         """
-        data = self._make_request('GET', f'/status/{uid}')
+        data = self._make_request('GET', f'/status/{uid}', deadline=deadline)
         return StatusResponse(**data)
 
-    def wait_for_completion(self, uid: str, poll_interval: float = 2.0, timeout: Optional[float] = None) -> StatusResponse:
+    def wait_for_completion(self, uid: str, poll_interval: float = 0.5,
+                            max_interval: float = 15.0,
+                            timeout: Optional[float] = None,
+                            deadline: Optional[float] = None) -> StatusResponse:
         """
         Wait for a generation task to complete.
 
+        The wait between status checks starts at poll_interval and doubles
+        after every check up to max_interval, with a small jitter applied to
+        each sleep. Short jobs are still detected quickly while long jobs
+        generate far fewer status requests than fixed-interval polling.
+
         Args:
             uid: The unique identifier of the generation task
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds
+            max_interval: Upper bound for the backed-off check interval
             timeout: Maximum time to wait in seconds (None for no timeout)
+            deadline: Optional absolute time.monotonic() deadline covering
+                the whole wait, including each status request's own timeout
 
         Returns:
             StatusResponse: Final status of the task
@@ -317,29 +566,40 @@ class Hunyuan3DAPIClient:
         Raises:
             Hunyuan3DAPIError: If the task fails or times out
         """
-        start_time = time.time()
+        if timeout is not None:
+            timeout_deadline = time.monotonic() + timeout
+            deadline = (timeout_deadline if deadline is None
+                        else min(deadline, timeout_deadline))
+        delay = poll_interval
 
         while True:
-            status_response = self.get_task_status(uid)
+            status_response = self.get_task_status(uid, deadline=deadline)
 
-            if status_response.status == TaskStatus.COMPLETED:
+            status = status_response.status
+            if status == _TERMINAL_OK:
                 return status_response
-            elif status_response.status == TaskStatus.ERROR:
+            elif status == _TERMINAL_ERR:
                 raise Hunyuan3DAPIError(
                     f"Task failed: {status_response.message}"
                 )
 
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                raise Hunyuan3DAPIError(
-                    f"Task timed out after {timeout} seconds"
-                )
-
-            time.sleep(poll_interval)
+            # Capped exponential backoff with +/-15% jitter so concurrent
+            # pollers do not fall into lockstep; never sleep past the deadline
+            sleep_for = delay * random.uniform(0.85, 1.15)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Hunyuan3DAPIError(
+                        f"Task {uid} did not complete before the deadline"
+                    )
+                sleep_for = min(sleep_for, remaining)
+            time.sleep(sleep_for)
+            delay = min(delay * 2, max_interval)
 
     def generate_3d_model_async(self, request: GenerationRequest,
-                               poll_interval: float = 2.0,
-                               timeout: Optional[float] = None) -> bytes:
+                               poll_interval: float = 0.5,
+                               timeout: Optional[float] = None,
+                               out_path: Optional[str] = None) -> Optional[bytes]:
         """
         Generate a 3D model asynchronously and wait for completion.
 
@@ -347,31 +607,71 @@ class Hunyuan3DAPIClient:
 
         Args:
             request: GenerationRequest containing the image and generation parameters
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds
             timeout: Maximum time to wait in seconds (None for no timeout)
+            out_path: When given, the model is decoded chunk-wise straight
+                to this file and the decoded bytes are never held in full
 
         Returns:
-            bytes: The generated 3D model file (GLB or OBJ format)
+            bytes: The generated 3D model file (GLB or OBJ format), or None
+                when out_path was given
 
         Raises:
             Hunyuan3DAPIError: If the generation fails or times out
             Hunyuan3DAPIValidationError: If the request parameters are invalid
         """
+        # One deadline covers submission, every poll and the final fetch,
+        # so a stuck connect on the last status check cannot extend the
+        # caller's budget by another request timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
         # Send the task
-        response = self.send_generation_task(request)
+        response = self.send_generation_task(request, deadline=deadline)
 
         # Wait for completion
         status_response = self.wait_for_completion(
-            response.uid, poll_interval, timeout
+            response.uid, poll_interval=poll_interval, deadline=deadline
         )
 
-        # Return the model data
-        if status_response.model_base64:
-            return base64.b64decode(status_response.model_base64)
-        else:
-            raise Hunyuan3DAPIError(
-                "No model data received from completed task"
-            )
+        return self._decode_model(status_response, out_path)
+
+    def generate_3d_models_batch(self, requests_batch: list[GenerationRequest],
+                                 max_inflight: int = 4) -> Dict[str, StatusResponse]:
+        """
+        Submit several generation tasks and wait for all of them.
+
+        Submission and the subsequent status polling run on a thread pool so
+        network latency and server-side queueing overlap across tasks instead
+        of serializing one long inference after another.
+
+        Args:
+            requests_batch: GenerationRequest objects to submit
+            max_inflight: Maximum number of tasks submitted/polled at once
+
+        Returns:
+            Dict mapping each task uid to its final StatusResponse
+
+        Raises:
+            Hunyuan3DAPIError: If any submission or task fails
+            Hunyuan3DAPIValidationError: If any request parameters are invalid
+        """
+        results: Dict[str, StatusResponse] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max_inflight, thread_name_prefix='hunyuan3d-batch'
+        ) as executor:
+            uids = [
+                response.uid
+                for response in executor.map(self.send_generation_task, requests_batch)
+            ]
+            futures = {
+                executor.submit(self.wait_for_completion, uid): uid
+                for uid in uids
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
 
     def save_model_to_file(self, model_data: bytes, file_path: str) -> None:
         """
@@ -424,11 +724,8 @@ def generate_3d_model_from_image(image_path: str,
             **kwargs
         )
 
-        # Generate the model
-        model_data = client.generate_3d_model_async(request)
-
-        # Save to file
-        client.save_model_to_file(model_data, output_path)
+        # Generate the model, decoding straight to the output file
+        client.generate_3d_model_async(request, out_path=output_path)
         print(f"3D model generated successfully and saved to: {output_path}")
 
 
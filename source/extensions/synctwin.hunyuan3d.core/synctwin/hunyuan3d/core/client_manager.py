@@ -14,36 +14,68 @@ Hunyuan3D Client Manager
 Singleton client manager that handles all Hunyuan3D API requests and task management.
 """
 
+import functools
+import hashlib
+import logging
+import os
+import random
+import shutil
 import threading
 import time
 import tempfile
 import base64
 import asyncio
-from typing import Optional, Dict, Any, Callable, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 import omni.kit.asset_converter as converter
 import omni.kit.app
+try:
+    # Optional SIMD base64 codec (libbase64); several times faster than the
+    # stdlib on the multi-MB GLB payloads, with identical semantics.
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
 from .api_client import (
-    Hunyuan3DAPIClient, 
-    GenerationRequest, 
+    Hunyuan3DAPIClient,
+    GenerationRequest,
     Hunyuan3DAPIError,
     Hunyuan3DAPIValidationError,
     StatusResponse
 )
 
+logger = logging.getLogger(__name__)
 
-class TaskState(str, Enum):
-    """Task states managed by the client."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    TEXTURING = "texturing"
-    CONVERTING = "converting"
-    COMPLETED = "completed"
-    FAILED = "failed"
+
+class TaskState(IntEnum):
+    """
+    Task states managed by the client.
+
+    IntEnum so the polling hot path compares states as integers rather
+    than strings; the state never leaves the process, so use .name when
+    a readable form is needed in logs.
+    """
+    PENDING = 0
+    PROCESSING = 1
+    TEXTURING = 2
+    CONVERTING = 3
+    COMPLETED = 4
+    FAILED = 5
+    CANCELLED = 6
 
 
-@dataclass
+# States in which a task still needs status polling / conversion tracking.
+_ACTIVE_STATES = frozenset({
+    TaskState.PENDING,
+    TaskState.PROCESSING,
+    TaskState.TEXTURING,
+    TaskState.CONVERTING,
+})
+
+
+@dataclass(slots=True)
 class TaskInfo:
     """Information about a generation task."""
     task_uid: str
@@ -55,7 +87,60 @@ class TaskInfo:
     completion_callback: Optional[Callable[[str, bool, str], None]] = None  # (task_uid, success, path_or_error)
     state: TaskState = TaskState.PENDING
     glb_path: Optional[str] = None
+    glb_hash: Optional[str] = None
     temp_dir: Optional[str] = None
+    # Adaptive polling schedule (time.monotonic() based)
+    current_interval: float = 0.0
+    next_poll_at: float = 0.0
+    last_status: Optional[str] = None
+    dedup_key: Optional[str] = None
+    consecutive_errors: int = 0
+
+
+# Adaptive polling: back off while a task keeps reporting the same
+# non-terminal status, reset as soon as the status changes.
+_POLL_BACKOFF_FACTOR = 1.5
+_MAX_POLL_INTERVAL = 10.0
+
+# Consecutive status-check failures tolerated before a task is declared
+# failed; transient errors are retried with exponential jittered backoff.
+_MAX_CONSECUTIVE_ERRORS = 3
+
+# Base64 characters decoded per chunk when writing the GLB payload to disk
+# (must be a multiple of 4 so each slice is a valid base64 quantum).
+_B64_CHUNK = 4 * (1 << 18)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_image_payload_impl(cache_key) -> str:
+    path = cache_key[0]
+    with open(path, 'rb') as f:
+        return _b64.b64encode(f.read()).decode('utf-8')
+
+
+def _chain_callbacks(first: Optional[Callable], second: Optional[Callable]) -> Optional[Callable]:
+    """Combine two optional callbacks into one that invokes both in order."""
+    if first is None:
+        return second
+    if second is None or second is first:
+        return first
+
+    def chained(*args):
+        first(*args)
+        second(*args)
+
+    return chained
+
+
+def _cached_image_payload(image_path: str) -> str:
+    """
+    Base64 payload for an image file, cached across submissions.
+
+    Keyed on (path, mtime, size) so re-submitting the same image skips the
+    read + encode while an edited file naturally misses the cache.
+    """
+    st = os.stat(image_path)
+    return _cached_image_payload_impl((image_path, st.st_mtime_ns, st.st_size))
 
 
 class Hunyuan3dClientManager:
@@ -68,36 +153,35 @@ class Hunyuan3dClientManager:
     - Status polling in background thread
     - GLB to USD conversion
     - Progress reporting and callbacks
+
+    Use get_client_manager() to obtain the shared instance; constructing the
+    class directly creates an independent manager with its own polling thread.
     """
-    
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
+
     def __init__(self):
-        if self._initialized:
-            return
-            
-        self._initialized = True
+        self._lock = threading.Lock()
         self._tasks: Dict[str, TaskInfo] = {}
-        self._active_tasks: Set[str] = set()
+        self._dedup: Dict[str, str] = {}  # submission hash -> task_uid
+        self._usd_source_hash: Dict[str, str] = {}  # usd path -> GLB hash
+        self._clients: Dict[str, Hunyuan3DAPIClient] = {}
+        self._poll_executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="hunyuan3d-poll"
+        )
         self._polling_thread = None
         self._stop_polling = False
+        self._wake = threading.Event()
         self._poll_interval = 2.0
         self._default_base_url = "http://localhost:8081"
+        # One temp parent for all tasks; per-task subdirs are named by uid so
+        # each submission costs a single mkdir instead of mkdtemp's retry loop.
+        self._tmp_root = tempfile.mkdtemp(prefix="hunyuan3d_")
         
         # Start the polling thread
         self._start_polling_thread()
         
         # Event subscription (will be set up in subscribe_to_conversion_events)
         self._conversion_subscription = None
+        self._event_dispatcher = None
     
     def set_default_base_url(self, base_url: str):
         """Set the default base URL for API requests."""
@@ -106,17 +190,35 @@ class Hunyuan3dClientManager:
     def set_poll_interval(self, interval: float):
         """Set the polling interval in seconds."""
         self._poll_interval = interval
+
+    def _get_client(self, base_url: str) -> Hunyuan3DAPIClient:
+        """
+        Get (or lazily create) the persistent API client for a base URL.
+
+        One client per base_url is kept alive for the lifetime of the manager so
+        status polling reuses keep-alive connections instead of re-establishing
+        TCP/TLS on every tick. Connection pooling and transient-error retries
+        are configured by Hunyuan3DAPIClient itself.
+        """
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                client = Hunyuan3DAPIClient(base_url)
+                self._clients[base_url] = client
+            return client
     
     def subscribe_to_conversion_events(self):
         """Subscribe to hunyuan3d_start_conversion events."""
         if self._conversion_subscription is None:
             from carb.eventdispatcher import get_eventdispatcher
-            self._conversion_subscription = get_eventdispatcher().observe_event(
+            # Keep the dispatcher handle so shutdown does not re-resolve it
+            self._event_dispatcher = get_eventdispatcher()
+            self._conversion_subscription = self._event_dispatcher.observe_event(
                 observer_name="Hunyuan3D Client Manager",
                 event_name="hunyuan3d_start_conversion",
                 on_event=_handle_usd_conversion_request
             )
-            print("[Hunyuan3dClientManager] Subscribed to hunyuan3d_start_conversion event")
+            logger.debug("Subscribed to hunyuan3d_start_conversion event")
     
     def submit_task(
         self,
@@ -146,17 +248,50 @@ class Hunyuan3dClientManager:
         """
         if base_url is None:
             base_url = self._default_base_url
+
+        # Idempotency: re-submitting the same image with the same parameters
+        # while the original task is still in flight returns the existing
+        # task_uid instead of burning server GPU time on a duplicate.
+        dedup_key = hashlib.blake2b(
+            repr((
+                image_path,
+                os.stat(image_path).st_mtime_ns,
+                tuple(sorted(generation_params.items())),
+                base_url,
+            )).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        with self._lock:
+            existing_uid = self._dedup.get(dedup_key)
+            if existing_uid is not None:
+                existing = self._tasks.get(existing_uid)
+                if existing is not None and existing.state in _ACTIVE_STATES:
+                    # Fan the new submission's callbacks onto the in-flight
+                    # task so the deduplicated caller still hears about
+                    # progress and completion.
+                    existing.progress_callback = _chain_callbacks(
+                        existing.progress_callback, progress_callback)
+                    existing.completion_callback = _chain_callbacks(
+                        existing.completion_callback, completion_callback)
+                    logger.debug("Reusing in-flight task %s for identical submission", existing_uid)
+                    return existing_uid
+
+        # Create generation request (re-submits of an unchanged image reuse
+        # the cached base64 payload instead of re-reading the file)
+        request = GenerationRequest.from_image_file(
+            image_path,
+            image_base64=_cached_image_payload(image_path),
+            **generation_params
+        )
         
-        # Create generation request
-        request = GenerationRequest.from_image_file(image_path, **generation_params)
-        
-        # Submit to API
-        with Hunyuan3DAPIClient(base_url) as client:
-            response = client.send_generation_task(request)
-            task_uid = response.uid
+        # Submit to API (reuses the pooled per-base_url client)
+        response = self._get_client(base_url).send_generation_task(request)
+        task_uid = response.uid
         
-        # Create temp directory for this task
-        temp_dir = tempfile.mkdtemp()
+        # Create temp directory for this task under the shared parent
+        temp_dir = os.path.join(self._tmp_root, task_uid)
+        os.makedirs(temp_dir, exist_ok=True)
         
         # Store task info
         task_info = TaskInfo(
@@ -167,23 +302,31 @@ class Hunyuan3dClientManager:
             generation_params=generation_params,
             progress_callback=progress_callback,
             completion_callback=completion_callback,
-            temp_dir=temp_dir
+            temp_dir=temp_dir,
+            dedup_key=dedup_key
         )
         
         with self._lock:
             self._tasks[task_uid] = task_info
-            self._active_tasks.add(task_uid)
+            self._dedup[dedup_key] = task_uid
+        
+        # Wake the polling loop so the first status check happens right away
+        self._wake.set()
         
         if progress_callback:
             progress_callback(task_uid, "Generation started")
         
-        print(f"[Hunyuan3dClientManager] Submitted task {task_uid}")
+        logger.debug("Submitted task %s", task_uid)
         return task_uid
     
     def get_task_info(self, task_uid: str) -> Optional[TaskInfo]:
         """Get information about a task."""
-        with self._lock:
-            return self._tasks.get(task_uid)
+        return self._tasks.get(task_uid)
+
+    def is_task_active(self, task_uid: str) -> bool:
+        """Whether a task is still pending, generating or converting."""
+        task_info = self._tasks.get(task_uid)
+        return task_info is not None and task_info.state in _ACTIVE_STATES
     
     def cancel_task(self, task_uid: str) -> bool:
         """
@@ -195,143 +338,226 @@ class Hunyuan3dClientManager:
         Returns:
             True if task was found and cancelled
         """
-        with self._lock:
-            if task_uid in self._tasks:
-                task_info = self._tasks[task_uid]
-                self._active_tasks.discard(task_uid)
-                
-                # Clean up temp directory
-                self._cleanup_task_files(task_info)
-                
-                print(f"[Hunyuan3dClientManager] Cancelled task {task_uid}")
-                return True
-        return False
+        task_info = self._tasks.get(task_uid)
+        if task_info is None:
+            return False
+
+        task_info.state = TaskState.CANCELLED
+        self._evict_dedup_entry(task_info)
+
+        # Clean up temp directory
+        self._cleanup_task_files(task_info)
+
+        self._wake.set()
+        logger.debug("Cancelled task %s", task_uid)
+        return True
     
     def cleanup_completed_task(self, task_uid: str):
         """Clean up a completed task's resources."""
-        with self._lock:
-            if task_uid in self._tasks:
-                task_info = self._tasks[task_uid]
-                self._cleanup_task_files(task_info)
-                print(f"[Hunyuan3dClientManager] Cleaned up completed task {task_uid}")
+        task_info = self._tasks.get(task_uid)
+        if task_info is not None:
+            self._cleanup_task_files(task_info)
+            logger.debug("Cleaned up completed task %s", task_uid)
     
+    def _evict_dedup_entry(self, task_info: TaskInfo):
+        """Drop a cancelled/failed task from the submission dedup map."""
+        if task_info.dedup_key:
+            with self._lock:
+                self._dedup.pop(task_info.dedup_key, None)
+
     def _cleanup_task_files(self, task_info: TaskInfo):
         """Clean up temporary files for a task."""
-        import os
-        import shutil
-        
-        # Remove GLB file
-        if task_info.glb_path and os.path.exists(task_info.glb_path):
+        # Single removal syscall; missing_ok covers the already-gone case
+        # without a racy exists() check first.
+        if task_info.glb_path:
             try:
-                os.remove(task_info.glb_path)
-            except Exception as e:
-                print(f"[Hunyuan3dClientManager] Failed to remove GLB: {e}")
+                Path(task_info.glb_path).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Failed to remove GLB: %s", e)
         
-        # Remove temp directory
-        if task_info.temp_dir and os.path.exists(task_info.temp_dir):
-            try:
-                shutil.rmtree(task_info.temp_dir)
-            except Exception as e:
-                print(f"[Hunyuan3dClientManager] Failed to remove temp dir: {e}")
+        if task_info.temp_dir:
+            shutil.rmtree(task_info.temp_dir, ignore_errors=True)
     
     def _start_polling_thread(self):
         """Start the background polling thread."""
         self._stop_polling = False
         self._polling_thread = threading.Thread(target=self._polling_loop, daemon=True)
         self._polling_thread.start()
-        print("[Hunyuan3dClientManager] Started polling thread")
+        logger.debug("Started polling thread")
     
     def _polling_loop(self):
         """Main polling loop that runs in background thread."""
         while not self._stop_polling:
-            # Get snapshot of active tasks
-            with self._lock:
-                active_task_uids = list(self._active_tasks)
-            
+            # Lock-free snapshot: list() over the dict values is atomic under
+            # the GIL, and activeness is derived from each task's own state.
+            # Only tasks that are due per their adaptive schedule get polled;
+            # freshly submitted tasks are due immediately.
+            now = time.monotonic()
+            active_tasks = [
+                task_info for task_info in list(self._tasks.values())
+                if task_info.state in _ACTIVE_STATES
+            ]
+            active_task_uids = [
+                task_info.task_uid for task_info in active_tasks
+                if task_info.next_poll_at <= now
+            ]
+
             if not active_task_uids:
-                time.sleep(self._poll_interval)
+                # Nothing due yet: sleep until the earliest deadline instead
+                # of a fixed tick, so a just-polled task is not re-checked
+                # and a soon-due one is not kept waiting. Submissions and
+                # completions wake us early via the event. Converting tasks
+                # park their deadline at infinity, which Event.wait cannot
+                # take, so they fall back to the fixed tick.
+                deadlines = [
+                    t.next_poll_at for t in active_tasks
+                    if t.next_poll_at != float("inf")
+                ]
+                if deadlines:
+                    timeout = max(0.0, min(deadlines) - now)
+                else:
+                    timeout = self._poll_interval
+                self._wake.wait(timeout or self._poll_interval)
+                self._wake.clear()
                 continue
-            
-            # Check each active task
-            for task_uid in active_task_uids:
+
+            # Check all active tasks concurrently so one tick costs a single
+            # round-trip instead of K serial ones. The per-base_url clients
+            # from _get_client() make this safe: requests.Session is
+            # thread-safe for concurrent requests and pools connections.
+            futures = {
+                self._poll_executor.submit(self._check_task_status, task_uid): task_uid
+                for task_uid in active_task_uids
+            }
+            for future in as_completed(futures):
                 try:
-                    self._check_task_status(task_uid)
+                    future.result()
                 except Exception as e:
-                    print(f"[Hunyuan3dClientManager] Error checking task {task_uid}: {e}")
-            
-            time.sleep(self._poll_interval)
-        
-        print("[Hunyuan3dClientManager] Polling thread stopped")
+                    logger.error("Error checking task %s: %s", futures[future], e)
+            # Loop straight back: the checks above pushed each task's
+            # next_poll_at forward, so the sleep branch picks the right wait.
+
+        logger.debug("Polling thread stopped")
     
     def _check_task_status(self, task_uid: str):
         """Check status of a single task."""
-        with self._lock:
-            task_info = self._tasks.get(task_uid)
-        
-        if not task_info or task_uid not in self._active_tasks:
+        task_info = self._tasks.get(task_uid)
+        if not task_info or task_info.state not in _ACTIVE_STATES:
             return
         
         try:
-            # Check API status
-            with Hunyuan3DAPIClient(task_info.base_url) as client:
-                status_response = client.get_task_status(task_uid)
-            
+            # Check API status (reuses the pooled per-base_url client)
+            status_response = self._get_client(task_info.base_url).get_task_status(task_uid)
+            task_info.consecutive_errors = 0
+
             # Update task state
             if status_response.status == "completed":
                 self._handle_generation_completed(task_uid, task_info, status_response)
             elif status_response.status == "error":
                 self._handle_generation_failed(task_uid, task_info, status_response.message or "Unknown error")
             else:
-                # Still processing
-                if task_info.progress_callback:
+                # Still processing: widen the poll interval while the status
+                # stays the same, reset it whenever the status changes.
+                status_changed = status_response.status != task_info.last_status
+                if status_changed:
+                    task_info.current_interval = self._poll_interval
+                else:
+                    task_info.current_interval = min(
+                        (task_info.current_interval or self._poll_interval) * _POLL_BACKOFF_FACTOR,
+                        _MAX_POLL_INTERVAL
+                    )
+                task_info.last_status = status_response.status
+                task_info.next_poll_at = time.monotonic() + task_info.current_interval
+
+                # Only report progress on an actual status change; repeating
+                # the same message every tick is pure overhead for the UI.
+                if status_changed and task_info.progress_callback:
                     task_info.progress_callback(task_uid, f"Status: {status_response.status}")
-        
+
         except Exception as e:
-            self._handle_generation_failed(task_uid, task_info, f"Status check failed: {str(e)}")
+            # A transient hiccup (connection reset, gateway blip) should not
+            # drop a generation that is still running server-side. Retry a
+            # few times with exponential jittered backoff before giving up.
+            task_info.consecutive_errors += 1
+            if task_info.consecutive_errors >= _MAX_CONSECUTIVE_ERRORS:
+                self._handle_generation_failed(task_uid, task_info, f"Status check failed: {str(e)}")
+            else:
+                backoff = min(30.0, 2 ** task_info.consecutive_errors) + random.random()
+                task_info.next_poll_at = time.monotonic() + backoff
+                logger.warning(
+                    "Status check for task %s failed (%d/%d), retrying in %.1fs: %s",
+                    task_uid, task_info.consecutive_errors, _MAX_CONSECUTIVE_ERRORS, backoff, e
+                )
     
     def _handle_generation_completed(self, task_uid: str, task_info: TaskInfo, status_response: StatusResponse):
         """Handle completed generation."""
-        print(f"[Hunyuan3dClientManager] Generation completed for task {task_uid}")
+        logger.debug("Generation completed for task %s", task_uid)
         
         if not status_response.model_base64:
             self._handle_generation_failed(task_uid, task_info, "No model data received")
             return
         
         try:
-            # Save GLB file
-            model_data = base64.b64decode(status_response.model_base64)
-            glb_path = f"{task_info.temp_dir}/{task_uid}.glb"
-            
+            # Save GLB file, decoding the base64 payload in chunks so peak
+            # memory stays at one chunk instead of payload + full decoded copy.
+            glb_path = os.path.join(task_info.temp_dir, f"{task_uid}.glb")
+            encoded = status_response.model_base64
+
+            # Reject a truncated payload up front rather than failing midway
+            # through the chunked decode with a half-written GLB on disk.
+            if len(encoded) % 4:
+                self._handle_generation_failed(
+                    task_uid, task_info,
+                    "Model payload is truncated (base64 length not a multiple of 4)"
+                )
+                return
+
+            # Hash while writing so an unchanged regeneration can skip the
+            # USD conversion below at no extra read cost.
+            digest = hashlib.blake2b(digest_size=16)
             with open(glb_path, "wb") as f:
-                f.write(model_data)
-            
+                for i in range(0, len(encoded), _B64_CHUNK):
+                    chunk = _b64.b64decode(encoded[i:i + _B64_CHUNK])
+                    digest.update(chunk)
+                    f.write(chunk)
+
             task_info.glb_path = glb_path
+            task_info.glb_hash = digest.hexdigest()
             task_info.state = TaskState.CONVERTING
+            # Conversion progress comes from the converter, not the server;
+            # park the poll deadline so this task is never re-fetched.
+            task_info.next_poll_at = float("inf")
             
             if task_info.progress_callback:
                 task_info.progress_callback(task_uid, "Converting to USD...")
             
-            # Start USD conversion on main thread
-            omni.kit.app.queue_event(
-                "hunyuan3d_start_conversion",
-                payload={
-                    "task_uid": task_uid,
-                    "glb_path": glb_path,
-                    "usd_path": task_info.output_usd_path
-                }
-            )
+            # Start USD conversion on the main thread. The poller normally
+            # runs on a worker thread and must hop through the event queue,
+            # but when already on the main thread the handler can be invoked
+            # directly, skipping a queue-and-dispatch round trip.
+            payload = {
+                "task_uid": task_uid,
+                "glb_path": glb_path,
+                "usd_path": task_info.output_usd_path
+            }
+            if threading.current_thread() is threading.main_thread():
+                _handle_usd_conversion_request(payload)
+            else:
+                omni.kit.app.queue_event("hunyuan3d_start_conversion", payload=payload)
             
         except Exception as e:
             self._handle_generation_failed(task_uid, task_info, f"Failed to process GLB: {str(e)}")
+        finally:
+            self._wake.set()
     
     def _handle_generation_failed(self, task_uid: str, task_info: TaskInfo, error_message: str):
         """Handle generation failure."""
-        print(f"[Hunyuan3dClientManager] Generation failed for task {task_uid}: {error_message}")
-        
-        with self._lock:
-            self._active_tasks.discard(task_uid)
-            task_info.state = TaskState.FAILED
+        logger.error("Generation failed for task %s: %s", task_uid, error_message)
         
+        task_info.state = TaskState.FAILED
+        self._evict_dedup_entry(task_info)
+        self._wake.set()
+
         if task_info.progress_callback:
             task_info.progress_callback(task_uid, f"Failed: {error_message}")
         
@@ -340,21 +566,21 @@ class Hunyuan3dClientManager:
     
     def _handle_conversion_completed(self, task_uid: str, success: bool, result_path_or_error: str):
         """Handle USD conversion completion."""
-        with self._lock:
-            task_info = self._tasks.get(task_uid)
-            if task_info:
-                self._active_tasks.discard(task_uid)
-                task_info.state = TaskState.COMPLETED if success else TaskState.FAILED
-        
+        task_info = self._tasks.get(task_uid)
         if not task_info:
             return
+        task_info.state = TaskState.COMPLETED if success else TaskState.FAILED
         
         if success:
-            print(f"[Hunyuan3dClientManager] USD conversion completed for task {task_uid}: {result_path_or_error}")
+            logger.debug("USD conversion completed for task %s: %s", task_uid, result_path_or_error)
+            # Remember which GLB produced this USD so an identical
+            # regeneration can skip the converter entirely.
+            if task_info.glb_hash:
+                self._usd_source_hash[task_info.output_usd_path] = task_info.glb_hash
             if task_info.progress_callback:
                 task_info.progress_callback(task_uid, "USD conversion completed")
         else:
-            print(f"[Hunyuan3dClientManager] USD conversion failed for task {task_uid}: {result_path_or_error}")
+            logger.error("USD conversion failed for task %s: %s", task_uid, result_path_or_error)
             if task_info.progress_callback:
                 task_info.progress_callback(task_uid, f"USD conversion failed: {result_path_or_error}")
         
@@ -363,78 +589,158 @@ class Hunyuan3dClientManager:
     
     def shutdown(self):
         """Shutdown the client manager."""
-        print("[Hunyuan3dClientManager] Shutting down...")
+        logger.debug("Shutting down...")
         
         # Unsubscribe from events
         if self._conversion_subscription:
             try:
-                from carb.eventdispatcher import get_eventdispatcher
-                dispatcher = get_eventdispatcher()
+                dispatcher = self._event_dispatcher
                 # Try different methods for unsubscribing
                 if hasattr(dispatcher, 'unsubscribe'):
                     dispatcher.unsubscribe(self._conversion_subscription)
                 elif hasattr(dispatcher, 'unsubscribe_event'):
                     dispatcher.unsubscribe_event(self._conversion_subscription)
                 else:
-                    print("[Hunyuan3dClientManager] Warning: No unsubscribe method found")
+                    logger.warning("No unsubscribe method found")
                 self._conversion_subscription = None
-                print("[Hunyuan3dClientManager] Unsubscribed from conversion events")
+                logger.debug("Unsubscribed from conversion events")
             except Exception as e:
-                print(f"[Hunyuan3dClientManager] Warning: Failed to unsubscribe from events: {e}")
+                logger.warning("Failed to unsubscribe from events: %s", e)
                 self._conversion_subscription = None
         
         # Stop polling
         self._stop_polling = True
+        self._wake.set()
         if self._polling_thread and self._polling_thread.is_alive():
             self._polling_thread.join(timeout=2.0)
+        self._poll_executor.shutdown(wait=False)
         
         # Clean up all tasks
         with self._lock:
             for task_info in self._tasks.values():
                 self._cleanup_task_files(task_info)
             self._tasks.clear()
-            self._active_tasks.clear()
+            self._dedup.clear()
+            self._usd_source_hash.clear()
+
+            # Close the pooled API clients
+            for client in self._clients.values():
+                try:
+                    client.close()
+                except Exception as e:
+                    logger.warning("Failed to close client: %s", e)
+            self._clients.clear()
         
-        print("[Hunyuan3dClientManager] Shutdown complete")
+        # Remove the shared temp parent (covers any leftover task subdirs)
+        shutil.rmtree(self._tmp_root, ignore_errors=True)
 
+        # Forget this instance so a later get_client_manager() (e.g. the
+        # extension being re-enabled) builds a fresh manager instead of
+        # handing out one whose polling thread is gone.
+        get_client_manager.cache_clear()
 
-# Global singleton instance
+        logger.debug("Shutdown complete")
+
+
+# Global singleton instance. functools.cache's C-level hit path makes every
+# call after the first a plain dict lookup, cheaper than the lock-guarded
+# double-checked __new__ this replaces.
+@functools.cache
 def get_client_manager() -> Hunyuan3dClientManager:
     """Get the global Hunyuan3D client manager instance."""
     return Hunyuan3dClientManager()
 
 
+# USD conversion pipeline (main thread): completed generations are queued and
+# drained by a single worker coroutine with bounded concurrency, so a burst of
+# completions cannot flood the asset converter with parallel tasks.
+_conversion_queue: asyncio.Queue = asyncio.Queue()
+_conversion_worker_future = None
+_MAX_CONCURRENT_CONVERSIONS = 2
+
+
+@functools.cache
+def _converter_instance():
+    """The asset-converter task manager, resolved once per process."""
+    return converter.get_instance()
+
+
+async def _convert_glb_to_usd(task_uid: str, glb_path: str, usd_path: str):
+    """Run one GLB to USD conversion and report the result to the manager."""
+    client_manager = get_client_manager()
+    try:
+        # Identical GLB already converted to this USD: reuse it. Checked
+        # here, on the main thread, so the completion callback fires from
+        # the same context as a real conversion would.
+        task_info = client_manager.get_task_info(task_uid)
+        if (task_info is not None and task_info.glb_hash is not None
+                and task_info.glb_hash == client_manager._usd_source_hash.get(usd_path)
+                and os.path.exists(usd_path)):
+            logger.debug("Skipping USD conversion for task %s: output up to date", task_uid)
+            client_manager._handle_conversion_completed(task_uid, True, usd_path)
+            return
+
+        def progress_callback(progress: float):
+            logger.debug("USD conversion task %s progress: %.1f%%", task_uid, progress * 100)
+
+        # Convert into a temp name and move it into place atomically, so a
+        # reader never sees a partially written USD and an old output stays
+        # intact if the conversion fails. The extension is preserved because
+        # the converter picks the output format from it.
+        root, ext = os.path.splitext(usd_path)
+        tmp_usd = f"{root}.tmp{ext}"
+
+        task = _converter_instance().create_converter_task(glb_path, tmp_usd, progress_callback)
+        success = await task.wait_until_finished()
+
+        if success:
+            os.replace(tmp_usd, usd_path)
+            client_manager._handle_conversion_completed(task_uid, True, usd_path)
+        else:
+            Path(tmp_usd).unlink(missing_ok=True)
+            client_manager._handle_conversion_completed(task_uid, False, task.get_error_message())
+
+    except Exception as e:
+        client_manager._handle_conversion_completed(task_uid, False, str(e))
+
+
+async def _conversion_worker():
+    """Drain the conversion queue with at most a few conversions in flight."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CONVERSIONS)
+
+    async def run_one(payload):
+        try:
+            await _convert_glb_to_usd(payload["task_uid"], payload["glb_path"], payload["usd_path"])
+        finally:
+            semaphore.release()
+
+    while True:
+        payload = await _conversion_queue.get()
+        await semaphore.acquire()
+        asyncio.ensure_future(run_one(payload))
+
+
 # USD conversion handler for main thread
 def _handle_usd_conversion_request(event):
-    """Handle USD conversion request on main thread."""
+    """Queue a USD conversion request for the shared worker."""
+    global _conversion_worker_future
+
     task_uid = event.get("task_uid")
     glb_path = event.get("glb_path")
     usd_path = event.get("usd_path")
-    
+
     if not all([task_uid, glb_path, usd_path]):
         return
-    
-    async def convert():
-        try:
-            def progress_callback(progress: float):
-                print(f"[USD Conversion] Task {task_uid} progress: {progress:.1%}")
-            
-            task_manager = converter.get_instance()
-            task = task_manager.create_converter_task(glb_path, usd_path, progress_callback)
-            success = await task.wait_until_finished()
-            
-            client_manager = get_client_manager()
-            if success:
-                client_manager._handle_conversion_completed(task_uid, True, usd_path)
-            else:
-                error_msg = task.get_error_message()
-                client_manager._handle_conversion_completed(task_uid, False, error_msg)
-                
-        except Exception as e:
-            client_manager = get_client_manager()
-            client_manager._handle_conversion_completed(task_uid, False, str(e))
-    
-    asyncio.ensure_future(convert())
+
+    _conversion_queue.put_nowait({
+        "task_uid": task_uid,
+        "glb_path": glb_path,
+        "usd_path": usd_path
+    })
+
+    # Lazily start the single drain worker on first use
+    if _conversion_worker_future is None or _conversion_worker_future.done():
+        _conversion_worker_future = asyncio.ensure_future(_conversion_worker())
 
 
 # Event handler is now set up through client manager's subscribe_to_conversion_events method
\ No newline at end of file
@@ -14,12 +14,32 @@ Hunyuan3D Commands
 Omniverse Kit commands for Hunyuan3D functionality including image-to-USD conversion.
 """
 
+import logging
 import os
+import types
+from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 import omni.kit.commands
 from .api_client import Hunyuan3DAPIError, Hunyuan3DAPIValidationError
 from .client_manager import get_client_manager
 
+logger = logging.getLogger(__name__)
+
+# Shared, read-only default generation parameters. Commands executed with
+# all-default parameters reference this single mapping instead of building
+# an identical dict per execution; submit_task treats the params as
+# read-only either way.
+_DEFAULT_PARAMS = types.MappingProxyType({
+    "remove_background": True,
+    "texture": False,
+    "seed": 1234,
+    "octree_resolution": 256,
+    "num_inference_steps": 5,
+    "guidance_scale": 5.0,
+    "num_chunks": 8000,
+    "face_count": 40000
+})
+
 
 class Hunyuan3dImageTo3d(omni.kit.commands.Command):
     """
@@ -76,8 +96,9 @@ class Hunyuan3dImageTo3d(omni.kit.commands.Command):
         self._progress_callback = progress_callback
         self._completion_callback = completion_callback
         
-        # Generation parameters
-        self._generation_params = {
+        # Generation parameters: reuse the frozen defaults when nothing was
+        # overridden, only materializing a fresh dict for custom values.
+        generation_params = {
             "remove_background": remove_background,
             "texture": texture,
             "seed": seed,
@@ -87,21 +108,26 @@ class Hunyuan3dImageTo3d(omni.kit.commands.Command):
             "num_chunks": num_chunks,
             "face_count": face_count
         }
+        if generation_params == _DEFAULT_PARAMS:
+            self._generation_params = _DEFAULT_PARAMS
+        else:
+            self._generation_params = generation_params
         
         # State for undo
         self._task_uid = None
+        self._last_reported_message = None
         
-        # Validate input
-        if not os.path.exists(image_path):
+        # Validate input with a single stat instead of exists() plus
+        # separate basename/splitext/dirname string passes
+        try:
+            os.stat(image_path)
+        except OSError:
             raise ValueError(f"Image file not found: {image_path}")
-            
+
         # Auto-generate output path if not provided
         if self._output_usd_path is None:
-            base_name = os.path.splitext(os.path.basename(image_path))[0]
-            self._output_usd_path = os.path.join(
-                os.path.dirname(image_path),
-                f"{base_name}_hunyuan3d.usd"
-            )
+            image_file = Path(image_path)
+            self._output_usd_path = str(image_file.with_name(f"{image_file.stem}_hunyuan3d.usd"))
 
     def do(self) -> Dict[str, Any]:
         """
@@ -117,17 +143,20 @@ class Hunyuan3dImageTo3d(omni.kit.commands.Command):
         try:
             client_manager = get_client_manager()
             
-            # Create progress callback that wraps the user's callback
+            # Create progress callback that wraps the user's callback,
+            # dropping consecutive duplicates so the UI is only poked on
+            # an actual change.
             def internal_progress_callback(task_uid: str, message: str):
-                if self._progress_callback:
+                if self._progress_callback and message != self._last_reported_message:
+                    self._last_reported_message = message
                     self._progress_callback(message)
             
             # Create completion callback for tracking
             def completion_callback(task_uid: str, success: bool, path_or_error: str):
                 if success:
-                    print(f"[Hunyuan3dImageTo3d] Task {task_uid} completed successfully: {path_or_error}")
+                    logger.info("Task %s completed successfully: %s", task_uid, path_or_error)
                 else:
-                    print(f"[Hunyuan3dImageTo3d] Task {task_uid} failed: {path_or_error}")
+                    logger.error("Task %s failed: %s", task_uid, path_or_error)
                 
                 # Call user's completion callback if provided
                 if self._completion_callback:
@@ -166,20 +195,20 @@ class Hunyuan3dImageTo3d(omni.kit.commands.Command):
         """
         try:
             if self._task_uid:
-                print(f"[Hunyuan3dImageTo3d] Undoing task {self._task_uid}")
+                logger.debug("Undoing task %s", self._task_uid)
                 client_manager = get_client_manager()
                 
                 # Cancel the task (this will clean up files too)
                 cancelled = client_manager.cancel_task(self._task_uid)
                 if cancelled:
-                    print(f"[Hunyuan3dImageTo3d] Successfully cancelled task {self._task_uid}")
+                    logger.debug("Successfully cancelled task %s", self._task_uid)
                 else:
-                    print(f"[Hunyuan3dImageTo3d] Task {self._task_uid} was not found (may have completed)")
+                    logger.debug("Task %s was not found (may have completed)", self._task_uid)
             else:
-                print("[Hunyuan3dImageTo3d] No task to undo")
+                logger.debug("No task to undo")
                 
         except Exception as e:
-            print(f"[Hunyuan3dImageTo3d] Warning: Failed to undo: {str(e)}")
+            logger.warning("Failed to undo: %s", e)
         finally:
             # Always clear the task UID, even if cancellation failed
             self._task_uid = None
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+"""Shared fixture helpers for the synctwin.hunyuan3d.core test suites."""
+
+import os
+import shutil
+import tempfile
+
+# Dummy payload standing in for a real image; the code under test only
+# stats the file, nothing decodes it.
+FAKE_IMAGE_BYTES = b"fake_image_data"
+
+
+def make_class_workspace(test_class, image_name="test_image.jpg"):
+    """
+    Create a class-scoped temp dir containing a fake input image.
+
+    The directory is registered with addClassCleanup right away, so it is
+    removed even if the rest of setUpClass fails. Returns
+    (temp_dir, image_path).
+    """
+    temp_dir = tempfile.mkdtemp()
+    test_class.addClassCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+    image_path = os.path.join(temp_dir, image_name)
+    with open(image_path, "wb") as f:
+        f.write(FAKE_IMAGE_BYTES)
+    return temp_dir, image_path
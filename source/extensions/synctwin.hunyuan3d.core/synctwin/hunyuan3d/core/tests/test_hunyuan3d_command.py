@@ -14,32 +14,51 @@
 
 import omni.kit.test
 import omni.kit.commands
-import tempfile
+import copy
 import os
-import shutil
 from unittest.mock import Mock, patch
 from synctwin.hunyuan3d.core.commands import Hunyuan3dImageTo3d
 from synctwin.hunyuan3d.core.api_client import Hunyuan3DAPIError, Hunyuan3DAPIValidationError
 from synctwin.hunyuan3d.core.client_manager import Hunyuan3dClientManager
+from .common import make_class_workspace
 
 
 class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
     """Test suite for Hunyuan3dImageTo3d command."""
-    
-    async def setUp(self):
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the temp dir and fake image once for the whole class."""
+        super().setUpClass()
+        cls.temp_dir, cls.test_image_path = make_class_workspace(cls)
+        # Spec introspection for the manager mock is paid once per class;
+        # tests share the instance and reset it between cases.
+        cls._manager_template = Mock(spec=Hunyuan3dClientManager)
+        # Pristine command for accessor tests; cases that mutate state take
+        # a shallow copy instead of re-running __init__.
+        cls._template_cmd = Hunyuan3dImageTo3d(image_path=cls.test_image_path)
+
+    def setUp(self):
         """Set up test fixtures before each test method."""
-        # Reset singleton instance before each test
-        Hunyuan3dClientManager._instance = None
-        
-        # Create temp directory and test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_image_path = os.path.join(self.temp_dir, "test_image.jpg")
-        self.test_output_path = os.path.join(self.temp_dir, "test_output.usd")
-        
-        # Create test image file
-        with open(self.test_image_path, "wb") as f:
-            f.write(b"fake_image_data")
-        
+        # Wipe per-test state from the shared mock and restore the stock
+        # behaviour, then divert the commands module to it.
+        self.mock_client_manager = self._manager_template
+        self.mock_client_manager.reset_mock(return_value=True, side_effect=True)
+        self.mock_client_manager.submit_task.return_value = "test-task-123"
+        self.mock_client_manager.cancel_task.return_value = True
+        patcher = patch(
+            'synctwin.hunyuan3d.core.commands.get_client_manager',
+            return_value=self.mock_client_manager
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Per-test output path under the shared temp dir (unique per test
+        # id so cases cannot collide)
+        self.test_output_path = os.path.join(
+            self.temp_dir, f"{self.id().rsplit('.', 1)[-1]}.usd"
+        )
+
         # Mock progress callback
         self.progress_callback = Mock()
         
@@ -54,16 +73,7 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
             "progress_callback": self.progress_callback
         }
     
-    async def tearDown(self):
-        """Clean up after each test method."""
-        # Clean up temp files
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-        
-        # Reset singleton
-        Hunyuan3dClientManager._instance = None
-    
-    async def test_command_init_with_valid_image(self):
+    def test_command_init_with_valid_image(self):
         """Test command initialization with valid image path."""
         command = Hunyuan3dImageTo3d(**self.default_params)
         
@@ -86,7 +96,7 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
         }
         self.assertEqual(command._generation_params, expected_params)
     
-    async def test_command_init_with_invalid_image(self):
+    def test_command_init_with_invalid_image(self):
         """Test command initialization with invalid image path."""
         params = self.default_params.copy()
         params["image_path"] = "/non/existent/image.jpg"
@@ -96,7 +106,7 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
         
         self.assertIn("Image file not found", str(context.exception))
     
-    async def test_command_init_auto_generated_output_path(self):
+    def test_command_init_auto_generated_output_path(self):
         """Test command initialization with auto-generated output path."""
         params = self.default_params.copy()
         del params["output_usd_path"]  # Remove explicit output path
@@ -107,20 +117,14 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
         expected_path = os.path.join(self.temp_dir, "test_image_hunyuan3d.usd")
         self.assertEqual(command._output_usd_path, expected_path)
     
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_do_success(self, mock_get_client_manager):
+    def test_command_do_success(self):
         """Test successful command execution."""
-        # Mock client manager
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.return_value = "test-task-123"
-        
         command = Hunyuan3dImageTo3d(**self.default_params)
         result = command.do()
-        
+
         # Verify client manager was called correctly
-        mock_client_manager.submit_task.assert_called_once()
-        call_args = mock_client_manager.submit_task.call_args
+        self.mock_client_manager.submit_task.assert_called_once()
+        call_args = self.mock_client_manager.submit_task.call_args
         
         self.assertEqual(call_args[1]["image_path"], self.test_image_path)
         self.assertEqual(call_args[1]["output_usd_path"], self.test_output_path)
@@ -144,144 +148,76 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
         # Verify task UID was stored
         self.assertEqual(command._task_uid, "test-task-123")
     
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_do_api_error(self, mock_get_client_manager):
-        """Test command execution with API error."""
-        # Mock client manager to raise API error
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.side_effect = Hunyuan3DAPIError("API Error")
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        with self.assertRaises(RuntimeError) as context:
-            command.do()
-        
-        self.assertIn("Hunyuan3D API error", str(context.exception))
-        self.assertIn("API Error", str(context.exception))
-    
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_do_validation_error(self, mock_get_client_manager):
-        """Test command execution with validation error."""
-        # Mock client manager to raise validation error
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        
-        # Create a proper ValidationError object
+    def test_command_do_errors(self):
+        """Test command execution error mapping for each failure kind."""
         from synctwin.hunyuan3d.core.api_client import ValidationError
-        mock_validation_error = ValidationError(
+        validation_error = ValidationError(
             loc=["field_name"],
             msg="Validation Error",
             type="value_error"
         )
-        mock_client_manager.submit_task.side_effect = Hunyuan3DAPIValidationError([mock_validation_error])
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        with self.assertRaises(RuntimeError) as context:
-            command.do()
-        
-        self.assertIn("Hunyuan3D API error", str(context.exception))
-        self.assertIn("Validation Error", str(context.exception))
-    
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_do_general_error(self, mock_get_client_manager):
-        """Test command execution with general error."""
-        # Mock client manager to raise general error
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.side_effect = Exception("General Error")
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        with self.assertRaises(RuntimeError) as context:
-            command.do()
-        
-        self.assertIn("Failed to start 3D generation", str(context.exception))
-        self.assertIn("General Error", str(context.exception))
-    
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_undo_with_task(self, mock_get_client_manager):
-        """Test command undo with active task."""
-        # Mock client manager
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.return_value = "test-task-123"
-        mock_client_manager.cancel_task.return_value = True
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        # Execute command first
-        command.do()
-        
-        # Now undo
-        command.undo()
-        
-        # Verify cancel_task was called
-        mock_client_manager.cancel_task.assert_called_once_with("test-task-123")
-        
-        # Verify task UID was cleared
-        self.assertIsNone(command._task_uid)
+
+        cases = [
+            (Hunyuan3DAPIError("API Error"), "Hunyuan3D API error", "API Error"),
+            (Hunyuan3DAPIValidationError([validation_error]), "Hunyuan3D API error", "Validation Error"),
+            (Exception("General Error"), "Failed to start 3D generation", "General Error"),
+        ]
+
+        for side_effect, expected_prefix, expected_detail in cases:
+            with self.subTest(error=type(side_effect).__name__):
+                self.mock_client_manager.submit_task.side_effect = side_effect
+
+                command = Hunyuan3dImageTo3d(**self.default_params)
+
+                with self.assertRaises(RuntimeError) as context:
+                    command.do()
+
+                self.assertIn(expected_prefix, str(context.exception))
+                self.assertIn(expected_detail, str(context.exception))
     
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_undo_with_completed_task(self, mock_get_client_manager):
-        """Test command undo with completed task (not found)."""
-        # Mock client manager
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.return_value = "test-task-123"
-        mock_client_manager.cancel_task.return_value = False  # Task not found
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        # Execute command first
-        command.do()
-        
-        # Now undo
-        command.undo()
-        
-        # Verify cancel_task was called
-        mock_client_manager.cancel_task.assert_called_once_with("test-task-123")
-        
-        # Verify task UID was cleared
-        self.assertIsNone(command._task_uid)
+    def test_command_undo(self):
+        """Test command undo across the cancel_task outcomes."""
+        cases = [
+            ("cancelled", {"return_value": True}),
+            ("not_found", {"return_value": False}),  # task completed already
+            ("error", {"side_effect": Exception("Cancel Error")}),
+        ]
+
+        for name, cancel_effect in cases:
+            with self.subTest(cancel=name):
+                cancel_task = self.mock_client_manager.cancel_task
+                cancel_task.reset_mock(return_value=True, side_effect=True)
+                for attr, value in cancel_effect.items():
+                    setattr(cancel_task, attr, value)
+
+                command = Hunyuan3dImageTo3d(**self.default_params)
+
+                # Execute command first
+                command.do()
+                self.assertEqual(command._task_uid, "test-task-123")
+
+                # Now undo (must not raise, even when cancel_task does)
+                command.undo()
+
+                # Verify cancel_task was called
+                cancel_task.assert_called_once_with("test-task-123")
+
+                # Verify task UID was cleared
+                self.assertIsNone(command._task_uid)
     
-    async def test_command_undo_without_task(self):
+    def test_command_undo_without_task(self):
         """Test command undo without active task."""
-        command = Hunyuan3dImageTo3d(**self.default_params)
+        command = copy.copy(self._template_cmd)
         
         # Undo without executing first
         command.undo()  # Should not raise exception
         
         self.assertIsNone(command._task_uid)
     
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_undo_with_error(self, mock_get_client_manager):
-        """Test command undo with error in cancel_task."""
-        # Mock client manager
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.submit_task.return_value = "test-task-123"
-        mock_client_manager.cancel_task.side_effect = Exception("Cancel Error")
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        # Execute command first
-        command.do()
-        
-        # Verify task UID was set
-        self.assertEqual(command._task_uid, "test-task-123")
-        
-        # Now undo (should not raise exception but should clear task_uid)
-        command.undo()
-        
-        # Verify task UID was cleared despite error (the finally block should handle this)
-        self.assertIsNone(command._task_uid)
-    
-    async def test_command_get_task_uid(self):
+    def test_command_get_task_uid(self):
         """Test getting task UID."""
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
+        command = copy.copy(self._template_cmd)
+
         # Initially no task UID
         self.assertIsNone(command.get_task_uid())
         
@@ -289,194 +225,151 @@ class TestHunyuan3dImageTo3d(omni.kit.test.AsyncTestCase):
         command._task_uid = "test-task-123"
         self.assertEqual(command.get_task_uid(), "test-task-123")
     
-    @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_get_task_info(self, mock_get_client_manager):
+    def test_command_get_task_info(self):
         """Test getting task info."""
-        # Mock client manager
-        mock_client_manager = Mock()
         mock_task_info = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        mock_client_manager.get_task_info.return_value = mock_task_info
-        
-        command = Hunyuan3dImageTo3d(**self.default_params)
-        
+        self.mock_client_manager.get_task_info.return_value = mock_task_info
+
+        command = copy.copy(self._template_cmd)
+
         # Initially no task info
         self.assertIsNone(command.get_task_info())
-        
+
         # Set task UID
         command._task_uid = "test-task-123"
         result = command.get_task_info()
-        
+
         # Verify client manager was called
-        mock_client_manager.get_task_info.assert_called_once_with("test-task-123")
+        self.mock_client_manager.get_task_info.assert_called_once_with("test-task-123")
         self.assertEqual(result, mock_task_info)
     
-    async def test_progress_callback_wrapper(self):
+    def test_progress_callback_wrapper(self):
         """Test progress callback wrapper functionality."""
         command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        # Mock submit_task to capture callbacks
-        with patch('synctwin.hunyuan3d.core.commands.get_client_manager') as mock_get_client_manager:
-            mock_client_manager = Mock()
-            mock_get_client_manager.return_value = mock_client_manager
-            mock_client_manager.submit_task.return_value = "test-task-123"
-            
-            # Execute command
-            command.do()
-            
-            # Get the progress callback that was passed
-            call_args = mock_client_manager.submit_task.call_args
-            progress_callback = call_args[1]["progress_callback"]
-            
-            # Test the callback wrapper
-            progress_callback("task-123", "Test message")
-            
-            # Verify user callback was called with just the message
-            self.progress_callback.assert_called_once_with("Test message")
+
+        # Execute command
+        command.do()
+
+        # Get the progress callback that was passed
+        call_args = self.mock_client_manager.submit_task.call_args
+        progress_callback = call_args[1]["progress_callback"]
+
+        # Test the callback wrapper
+        progress_callback("task-123", "Test message")
+
+        # Verify user callback was called with just the message
+        self.progress_callback.assert_called_once_with("Test message")
     
-    async def test_completion_callback_logging(self):
+    def test_completion_callback_logging(self):
         """Test completion callback logging functionality."""
         command = Hunyuan3dImageTo3d(**self.default_params)
-        
-        # Mock submit_task to capture callbacks
-        with patch('synctwin.hunyuan3d.core.commands.get_client_manager') as mock_get_client_manager:
-            mock_client_manager = Mock()
-            mock_get_client_manager.return_value = mock_client_manager
-            mock_client_manager.submit_task.return_value = "test-task-123"
-            
-            # Execute command
-            command.do()
-            
-            # Get the completion callback that was passed
-            call_args = mock_client_manager.submit_task.call_args
-            completion_callback = call_args[1]["completion_callback"]
-            
-            # Test successful completion
-            with patch('builtins.print') as mock_print:
-                completion_callback("task-123", True, "/path/to/output.usd")
-                mock_print.assert_called_with("[Hunyuan3dImageTo3d] Task task-123 completed successfully: /path/to/output.usd")
-            
-            # Test failed completion
-            with patch('builtins.print') as mock_print:
-                completion_callback("task-123", False, "Error message")
-                mock_print.assert_called_with("[Hunyuan3dImageTo3d] Task task-123 failed: Error message")
+
+        # Execute command
+        command.do()
+
+        # Get the completion callback that was passed
+        call_args = self.mock_client_manager.submit_task.call_args
+        completion_callback = call_args[1]["completion_callback"]
+
+        # Test successful completion
+        with patch('synctwin.hunyuan3d.core.commands.logger') as mock_logger:
+            completion_callback("task-123", True, "/path/to/output.usd")
+            mock_logger.info.assert_called_once_with(
+                "Task %s completed successfully: %s", "task-123", "/path/to/output.usd"
+            )
+
+        # Test failed completion
+        with patch('synctwin.hunyuan3d.core.commands.logger') as mock_logger:
+            completion_callback("task-123", False, "Error message")
+            mock_logger.error.assert_called_once_with(
+                "Task %s failed: %s", "task-123", "Error message"
+            )
 
 
 class TestHunyuan3dImageTo3dIntegration(omni.kit.test.AsyncTestCase):
     """Integration tests for Hunyuan3dImageTo3d command with omni.kit.commands."""
     
-    async def setUp(self):
-        """Set up test fixtures."""
-        # Reset singleton instance
-        Hunyuan3dClientManager._instance = None
-        
-        # Create temp directory and test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_image_path = os.path.join(self.temp_dir, "test_image.jpg")
-        
-        # Create test image file
-        with open(self.test_image_path, "wb") as f:
-            f.write(b"fake_image_data")
-    
-    async def tearDown(self):
-        """Clean up after each test."""
-        # Clean up temp files
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-        
-        # Reset singleton
-        Hunyuan3dClientManager._instance = None
-    
+    @classmethod
+    def setUpClass(cls):
+        """Create the fixtures and register the command once for the class."""
+        super().setUpClass()
+        cls.temp_dir, cls.test_image_path = make_class_workspace(cls)
+
+        # Ensure command is registered (it may already be registered by the
+        # extension, in which case ownership stays there)
+        try:
+            omni.kit.commands.register(Hunyuan3dImageTo3d)
+            cls._command_was_registered = True
+        except Exception:
+            # Command already registered
+            cls._command_was_registered = False
+
+    @classmethod
+    def tearDownClass(cls):
+        # Only unregister if we registered it
+        if cls._command_was_registered:
+            try:
+                omni.kit.commands.unregister(Hunyuan3dImageTo3d)
+            except Exception:
+                pass
+        super().tearDownClass()
+
     @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_registration_and_execution(self, mock_get_client_manager):
+    def test_command_registration_and_execution(self, mock_get_client_manager):
         """Test command registration and execution via omni.kit.commands."""
         # Mock client manager
         mock_client_manager = Mock()
         mock_get_client_manager.return_value = mock_client_manager
         mock_client_manager.submit_task.return_value = "test-task-123"
-        
-        # Ensure command is registered (it may already be registered by the extension)
-        try:
-            omni.kit.commands.register(Hunyuan3dImageTo3d)
-            command_was_registered = True
-        except Exception:
-            # Command already registered
-            command_was_registered = False
-        
-        try:
-            # Execute command via omni.kit.commands
-            result = omni.kit.commands.execute(
-                "Hunyuan3dImageTo3d",
-                image_path=self.test_image_path,
-                texture=True,
-                seed=42
-            )
-            
-            # omni.kit.commands.execute returns a tuple (success, result_dict)
-            if isinstance(result, tuple):
-                success, result_dict = result
-                self.assertTrue(success)
-                if result_dict:
-                    self.assertEqual(result_dict["task_uid"], "test-task-123")
-                    self.assertEqual(result_dict["image_path"], self.test_image_path)
-            else:
-                # Direct result dict (fallback)
-                self.assertTrue(result["success"])
-                self.assertEqual(result["task_uid"], "test-task-123")
-                self.assertEqual(result["image_path"], self.test_image_path)
-            
-            # Verify client manager was called
-            mock_client_manager.submit_task.assert_called_once()
-            
-        finally:
-            # Only unregister if we registered it
-            if command_was_registered:
-                try:
-                    omni.kit.commands.unregister(Hunyuan3dImageTo3d)
-                except Exception:
-                    pass
-    
+
+        # Execute command via omni.kit.commands
+        result = omni.kit.commands.execute(
+            "Hunyuan3dImageTo3d",
+            image_path=self.test_image_path,
+            texture=True,
+            seed=42
+        )
+
+        # omni.kit.commands.execute returns a tuple (success, result_dict)
+        if isinstance(result, tuple):
+            success, result_dict = result
+            self.assertTrue(success)
+            if result_dict:
+                self.assertEqual(result_dict["task_uid"], "test-task-123")
+                self.assertEqual(result_dict["image_path"], self.test_image_path)
+        else:
+            # Direct result dict (fallback)
+            self.assertTrue(result["success"])
+            self.assertEqual(result["task_uid"], "test-task-123")
+            self.assertEqual(result["image_path"], self.test_image_path)
+
+        # Verify client manager was called
+        mock_client_manager.submit_task.assert_called_once()
+
     @patch('synctwin.hunyuan3d.core.commands.get_client_manager')
-    async def test_command_undo_via_omni_commands(self, mock_get_client_manager):
+    def test_command_undo_via_omni_commands(self, mock_get_client_manager):
         """Test command undo via omni.kit.commands."""
         # Mock client manager
         mock_client_manager = Mock()
         mock_get_client_manager.return_value = mock_client_manager
         mock_client_manager.submit_task.return_value = "test-task-123"
         mock_client_manager.cancel_task.return_value = True
-        
-        # Ensure command is registered (it may already be registered by the extension)
-        try:
-            omni.kit.commands.register(Hunyuan3dImageTo3d)
-            command_was_registered = True
-        except Exception:
-            # Command already registered
-            command_was_registered = False
-        
-        try:
-            # Execute command
-            result = omni.kit.commands.execute(
-                "Hunyuan3dImageTo3d",
-                image_path=self.test_image_path
-            )
-            
-            # omni.kit.commands.execute returns a tuple (success, result_dict)
-            if isinstance(result, tuple):
-                success, result_dict = result
-                self.assertTrue(success)
-            else:
-                # Direct result dict (fallback)
-                self.assertTrue(result["success"])
-            
-            # Note: omni.kit.commands.undo() doesn't exist in this test environment
-            # In a real environment, the command would be undone through the command system
-            # For now, we'll verify that the command was executed successfully
-            # The undo functionality is tested separately in other tests
-            
-        finally:
-            # Only unregister if we registered it
-            if command_was_registered:
-                try:
-                    omni.kit.commands.unregister(Hunyuan3dImageTo3d)
-                except Exception:
-                    pass
\ No newline at end of file
+
+        # Execute command
+        result = omni.kit.commands.execute(
+            "Hunyuan3dImageTo3d",
+            image_path=self.test_image_path
+        )
+
+        # omni.kit.commands.execute returns a tuple (success, result_dict)
+        if isinstance(result, tuple):
+            success, result_dict = result
+            self.assertTrue(success)
+        else:
+            # Direct result dict (fallback)
+            self.assertTrue(result["success"])
+
+        # Note: omni.kit.commands.undo() doesn't exist in this test environment
+        # In a real environment, the command would be undone through the command system
+        # For now, we'll verify that the command was executed successfully
+        # The undo functionality is tested separately in other tests
\ No newline at end of file
@@ -13,13 +13,15 @@
 #   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
 
 import omni.kit.test
-import asyncio
+import logging
+import shutil
 import threading
 import tempfile
 import os
 import time
 import base64
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
+import synctwin.hunyuan3d.core.client_manager as client_manager_module
 from synctwin.hunyuan3d.core.client_manager import (
     Hunyuan3dClientManager,
     get_client_manager,
@@ -32,28 +34,41 @@ from synctwin.hunyuan3d.core.api_client import (
     Hunyuan3DAPIError,
     Hunyuan3DAPIValidationError
 )
+from .common import make_class_workspace
+
+logger = logging.getLogger(__name__)
+
+# Fake GLB payload and its base64 form, encoded once at import time instead
+# of per test. The fake image bytes live in common.FAKE_IMAGE_BYTES.
+_FAKE_GLB = b"fake_glb_data"
+_FAKE_GLB_B64 = base64.b64encode(_FAKE_GLB).decode()
 
 
 class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
     """Test suite for Hunyuan3dClientManager."""
-    
-    async def setUp(self):
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared temp dir and fake image once for the class."""
+        super().setUpClass()
+        cls.temp_dir, cls.test_image_path = make_class_workspace(cls)
+
+    def setUp(self):
         """Set up test fixtures before each test method."""
-        # Reset singleton instance before each test
-        Hunyuan3dClientManager._instance = None
-        
-        # Create a fresh client manager for each test
-        self.client_manager = Hunyuan3dClientManager()
-        
-        # Mock paths and files
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_image_path = os.path.join(self.temp_dir, "test_image.jpg")
-        self.test_usd_path = os.path.join(self.temp_dir, "test_output.usd")
-        
-        # Create test image file
-        with open(self.test_image_path, "wb") as f:
-            f.write(b"fake_image_data")
-        
+        # Reset the cached singleton before each test
+        get_client_manager.cache_clear()
+
+        # Create a fresh client manager for each test. Only the polling
+        # tests exercise the background thread, so construction skips it and
+        # those tests call _start_polling_thread() themselves.
+        with patch.object(Hunyuan3dClientManager, '_start_polling_thread', lambda _self: None):
+            self.client_manager = get_client_manager()
+
+        # Per-test output path under the shared temp dir
+        self.test_usd_path = os.path.join(
+            self.temp_dir, f"{self.id().rsplit('.', 1)[-1]}.usd"
+        )
+
         # Mock callbacks
         self.progress_callback = Mock()
         self.completion_callback = Mock()
@@ -65,53 +80,70 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
             "remove_background": False
         }
     
-    async def tearDown(self):
+    def tearDown(self):
         """Clean up after each test method."""
         # Shutdown client manager
         if hasattr(self, 'client_manager'):
             try:
                 self.client_manager.shutdown()
             except Exception as e:
-                print(f"Warning: Failed to shutdown client manager: {e}")
-        
-        # Clean up temp files
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-        
-        # Reset singleton
-        Hunyuan3dClientManager._instance = None
+                logger.warning("Failed to shutdown client manager: %s", e)
+
+        # Reset the cached singleton (the shared temp dir is removed once
+        # per class by the workspace helper)
+        get_client_manager.cache_clear()
     
-    async def test_singleton_pattern(self):
-        """Test that client manager follows singleton pattern."""
-        manager1 = Hunyuan3dClientManager()
-        manager2 = Hunyuan3dClientManager()
-        manager3 = get_client_manager()
+    @staticmethod
+    def _install_api_client(mock_api_client):
+        """Wire the patched Hunyuan3DAPIClient class to a single MagicMock.
+
+        MagicMock supports the context-manager protocol out of the box, so
+        no manual __enter__/__exit__ wiring is needed.
+        """
+        client = MagicMock()
+        mock_api_client.return_value = client
+        return client
+
+    def _make_task(self, task_uid="test-task-123"):
+        """Build a TaskInfo wired to the mock callbacks and register it."""
+        task_info = TaskInfo(
+            task_uid=task_uid,
+            image_path=self.test_image_path,
+            output_usd_path=self.test_usd_path,
+            base_url="http://localhost:8081",
+            generation_params=self.test_generation_params,
+            temp_dir=tempfile.mkdtemp(),
+            progress_callback=self.progress_callback,
+            completion_callback=self.completion_callback
+        )
+        self.client_manager._tasks[task_uid] = task_info
+        return task_info
+
+    def test_singleton_pattern(self):
+        """Test that the factory always returns the shared manager instance."""
+        manager1 = get_client_manager()
+        manager2 = get_client_manager()
         
         self.assertIs(manager1, manager2)
-        self.assertIs(manager2, manager3)
         self.assertIs(manager1, self.client_manager)
     
-    async def test_set_default_base_url(self):
+    def test_set_default_base_url(self):
         """Test setting default base URL."""
         test_url = "http://test-server:8080"
         self.client_manager.set_default_base_url(test_url)
         self.assertEqual(self.client_manager._default_base_url, test_url)
     
-    async def test_set_poll_interval(self):
+    def test_set_poll_interval(self):
         """Test setting poll interval."""
         test_interval = 5.0
         self.client_manager.set_poll_interval(test_interval)
         self.assertEqual(self.client_manager._poll_interval, test_interval)
     
     @patch('synctwin.hunyuan3d.core.client_manager.Hunyuan3DAPIClient')
-    async def test_submit_task_success(self, mock_api_client):
+    def test_submit_task_success(self, mock_api_client):
         """Test successful task submission."""
         # Mock API client response
-        mock_client_instance = Mock()
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_api_client.return_value = mock_client_instance
+        mock_client_instance = self._install_api_client(mock_api_client)
         
         mock_response = Mock()
         mock_response.uid = "test-task-123"
@@ -129,7 +161,7 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         # Verify task was submitted
         self.assertEqual(task_uid, "test-task-123")
         self.assertIn(task_uid, self.client_manager._tasks)
-        self.assertIn(task_uid, self.client_manager._active_tasks)
+        self.assertTrue(self.client_manager.is_task_active(task_uid))
         
         # Verify task info
         task_info = self.client_manager.get_task_info(task_uid)
@@ -141,15 +173,48 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         
         # Verify callbacks were called
         self.progress_callback.assert_called_once_with(task_uid, "Generation started")
-    
+
     @patch('synctwin.hunyuan3d.core.client_manager.Hunyuan3DAPIClient')
-    async def test_submit_task_api_error(self, mock_api_client):
+    def test_submit_task_dedup_attaches_callbacks(self, mock_api_client):
+        """A deduplicated submission still gets its callbacks invoked."""
+        mock_client_instance = self._install_api_client(mock_api_client)
+
+        mock_response = Mock()
+        mock_response.uid = "test-task-123"
+        mock_client_instance.send_generation_task.return_value = mock_response
+
+        first_uid = self.client_manager.submit_task(
+            image_path=self.test_image_path,
+            output_usd_path=self.test_usd_path,
+            generation_params=self.test_generation_params,
+            progress_callback=self.progress_callback,
+            completion_callback=self.completion_callback
+        )
+
+        second_completion = Mock()
+        second_uid = self.client_manager.submit_task(
+            image_path=self.test_image_path,
+            output_usd_path=self.test_usd_path,
+            generation_params=self.test_generation_params,
+            completion_callback=second_completion
+        )
+
+        # The in-flight task is reused, with a single API submission
+        self.assertEqual(second_uid, first_uid)
+        mock_client_instance.send_generation_task.assert_called_once()
+
+        # Completion reaches both the original and the deduplicated caller
+        task_info = self.client_manager.get_task_info(first_uid)
+        self.client_manager._handle_generation_failed(first_uid, task_info, "boom")
+        self.completion_callback.assert_called_once_with(first_uid, False, "boom")
+        second_completion.assert_called_once_with(first_uid, False, "boom")
+
+
+    @patch('synctwin.hunyuan3d.core.client_manager.Hunyuan3DAPIClient')
+    def test_submit_task_api_error(self, mock_api_client):
         """Test task submission with API error."""
         # Mock API client to raise error
-        mock_client_instance = Mock()
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_api_client.return_value = mock_client_instance
+        mock_client_instance = self._install_api_client(mock_api_client)
         
         mock_client_instance.send_generation_task.side_effect = Hunyuan3DAPIError("API Error")
         
@@ -161,7 +226,7 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
                 generation_params=self.test_generation_params
             )
     
-    async def test_cancel_task(self):
+    def test_cancel_task(self):
         """Test task cancellation."""
         # Add a mock task
         task_uid = "test-task-123"
@@ -175,59 +240,42 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         )
         
         self.client_manager._tasks[task_uid] = task_info
-        self.client_manager._active_tasks.add(task_uid)
         
         # Cancel task
         result = self.client_manager.cancel_task(task_uid)
         
         # Verify cancellation
         self.assertTrue(result)
-        self.assertNotIn(task_uid, self.client_manager._active_tasks)
+        self.assertFalse(self.client_manager.is_task_active(task_uid))
+        self.assertEqual(task_info.state, TaskState.CANCELLED)
         self.assertIn(task_uid, self.client_manager._tasks)  # Task info kept for reference
     
-    async def test_cancel_nonexistent_task(self):
+    def test_cancel_nonexistent_task(self):
         """Test cancelling non-existent task."""
         result = self.client_manager.cancel_task("non-existent-task")
         self.assertFalse(result)
     
     @patch('synctwin.hunyuan3d.core.client_manager.Hunyuan3DAPIClient')
-    async def test_check_task_status_completed(self, mock_api_client):
+    def test_check_task_status_completed(self, mock_api_client):
         """Test checking task status for completed task."""
         # Set up mock task
         task_uid = "test-task-123"
-        task_info = TaskInfo(
-            task_uid=task_uid,
-            image_path=self.test_image_path,
-            output_usd_path=self.test_usd_path,
-            base_url="http://localhost:8081",
-            generation_params=self.test_generation_params,
-            temp_dir=tempfile.mkdtemp(),
-            progress_callback=self.progress_callback,
-            completion_callback=self.completion_callback
-        )
-        
-        self.client_manager._tasks[task_uid] = task_info
-        self.client_manager._active_tasks.add(task_uid)
-        
+        task_info = self._make_task(task_uid)
+
         # Mock API client response
-        mock_client_instance = Mock()
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_api_client.return_value = mock_client_instance
+        mock_client_instance = self._install_api_client(mock_api_client)
         
         # Mock completed status with model data
-        mock_model_data = b"fake_glb_data"
-        mock_base64_data = base64.b64encode(mock_model_data).decode('utf-8')
-        
         mock_status_response = StatusResponse(
             status="completed",
-            model_base64=mock_base64_data,
+            model_base64=_FAKE_GLB_B64,
             message="Generation completed"
         )
         mock_client_instance.get_task_status.return_value = mock_status_response
         
-        # Mock omni.kit.app.queue_event
-        with patch('omni.kit.app.queue_event') as mock_queue_event:
+        # The test runs on the main thread, so the conversion request is
+        # dispatched directly instead of hopping through the event queue
+        with patch('synctwin.hunyuan3d.core.client_manager._handle_usd_conversion_request') as mock_dispatch:
             # Check task status
             self.client_manager._check_task_status(task_uid)
             
@@ -238,48 +286,30 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
             # Verify GLB file content
             with open(task_info.glb_path, "rb") as f:
                 saved_data = f.read()
-            self.assertEqual(saved_data, mock_model_data)
+            self.assertEqual(saved_data, _FAKE_GLB)
             
             # Verify state update
             self.assertEqual(task_info.state, TaskState.CONVERTING)
             
-            # Verify conversion event was queued
-            mock_queue_event.assert_called_once_with(
-                "hunyuan3d_start_conversion",
-                payload={
-                    "task_uid": task_uid,
-                    "glb_path": task_info.glb_path,
-                    "usd_path": task_info.output_usd_path
-                }
-            )
+            # Verify the conversion request was dispatched
+            mock_dispatch.assert_called_once_with({
+                "task_uid": task_uid,
+                "glb_path": task_info.glb_path,
+                "usd_path": task_info.output_usd_path
+            })
             
             # Verify progress callback
             self.progress_callback.assert_called_with(task_uid, "Converting to USD...")
     
     @patch('synctwin.hunyuan3d.core.client_manager.Hunyuan3DAPIClient')
-    async def test_check_task_status_failed(self, mock_api_client):
+    def test_check_task_status_failed(self, mock_api_client):
         """Test checking task status for failed task."""
         # Set up mock task
         task_uid = "test-task-123"
-        task_info = TaskInfo(
-            task_uid=task_uid,
-            image_path=self.test_image_path,
-            output_usd_path=self.test_usd_path,
-            base_url="http://localhost:8081",
-            generation_params=self.test_generation_params,
-            temp_dir=tempfile.mkdtemp(),
-            progress_callback=self.progress_callback,
-            completion_callback=self.completion_callback
-        )
-        
-        self.client_manager._tasks[task_uid] = task_info
-        self.client_manager._active_tasks.add(task_uid)
-        
+        task_info = self._make_task(task_uid)
+
         # Mock API client response
-        mock_client_instance = Mock()
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_api_client.return_value = mock_client_instance
+        mock_client_instance = self._install_api_client(mock_api_client)
         
         # Mock failed status
         mock_status_response = StatusResponse(
@@ -293,74 +323,39 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         
         # Verify state update
         self.assertEqual(task_info.state, TaskState.FAILED)
-        self.assertNotIn(task_uid, self.client_manager._active_tasks)
+        self.assertFalse(self.client_manager.is_task_active(task_uid))
         
         # Verify callbacks
         self.progress_callback.assert_called_with(task_uid, "Failed: Generation failed")
         self.completion_callback.assert_called_with(task_uid, False, "Generation failed")
     
-    async def test_handle_conversion_completed_success(self):
-        """Test handling successful USD conversion."""
-        # Set up mock task
-        task_uid = "test-task-123"
-        task_info = TaskInfo(
-            task_uid=task_uid,
-            image_path=self.test_image_path,
-            output_usd_path=self.test_usd_path,
-            base_url="http://localhost:8081",
-            generation_params=self.test_generation_params,
-            temp_dir=tempfile.mkdtemp(),
-            progress_callback=self.progress_callback,
-            completion_callback=self.completion_callback
-        )
-        
-        self.client_manager._tasks[task_uid] = task_info
-        self.client_manager._active_tasks.add(task_uid)
-        
-        # Handle conversion completion
-        self.client_manager._handle_conversion_completed(task_uid, True, self.test_usd_path)
-        
-        # Verify state update
-        self.assertEqual(task_info.state, TaskState.COMPLETED)
-        self.assertNotIn(task_uid, self.client_manager._active_tasks)
-        
-        # Verify callbacks
-        self.progress_callback.assert_called_with(task_uid, "USD conversion completed")
-        self.completion_callback.assert_called_with(task_uid, True, self.test_usd_path)
-    
-    async def test_handle_conversion_completed_failure(self):
-        """Test handling failed USD conversion."""
-        # Set up mock task
-        task_uid = "test-task-123"
-        task_info = TaskInfo(
-            task_uid=task_uid,
-            image_path=self.test_image_path,
-            output_usd_path=self.test_usd_path,
-            base_url="http://localhost:8081",
-            generation_params=self.test_generation_params,
-            temp_dir=tempfile.mkdtemp(),
-            progress_callback=self.progress_callback,
-            completion_callback=self.completion_callback
-        )
-        
-        self.client_manager._tasks[task_uid] = task_info
-        self.client_manager._active_tasks.add(task_uid)
-        
+    def test_handle_conversion_completed(self):
+        """Test handling successful and failed USD conversions."""
         error_message = "USD conversion failed"
-        
-        # Handle conversion completion
-        self.client_manager._handle_conversion_completed(task_uid, False, error_message)
-        
-        # Verify state update
-        self.assertEqual(task_info.state, TaskState.FAILED)
-        self.assertNotIn(task_uid, self.client_manager._active_tasks)
-        
-        # Verify callbacks
-        self.progress_callback.assert_called_with(task_uid, f"USD conversion failed: {error_message}")
-        self.completion_callback.assert_called_with(task_uid, False, error_message)
-    
+        cases = [
+            ("success", True, self.test_usd_path,
+             TaskState.COMPLETED, "USD conversion completed"),
+            ("failure", False, error_message,
+             TaskState.FAILED, f"USD conversion failed: {error_message}"),
+        ]
+        for name, success, payload, expected_state, expected_progress in cases:
+            with self.subTest(case=name):
+                task_uid = f"test-task-{name}"
+                task_info = self._make_task(task_uid)
+
+                # Handle conversion completion
+                self.client_manager._handle_conversion_completed(task_uid, success, payload)
+
+                # Verify state update
+                self.assertEqual(task_info.state, expected_state)
+                self.assertFalse(self.client_manager.is_task_active(task_uid))
+
+                # Verify callbacks
+                self.progress_callback.assert_called_with(task_uid, expected_progress)
+                self.completion_callback.assert_called_with(task_uid, success, payload)
+
     @patch('carb.eventdispatcher.get_eventdispatcher')
-    async def test_subscribe_to_conversion_events(self, mock_get_dispatcher):
+    def test_subscribe_to_conversion_events(self, mock_get_dispatcher):
         """Test subscribing to conversion events."""
         # Mock event dispatcher
         mock_dispatcher = Mock()
@@ -381,7 +376,7 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         self.assertEqual(self.client_manager._conversion_subscription, mock_subscription)
     
     @patch('carb.eventdispatcher.get_eventdispatcher')
-    async def test_subscribe_to_conversion_events_already_subscribed(self, mock_get_dispatcher):
+    def test_subscribe_to_conversion_events_already_subscribed(self, mock_get_dispatcher):
         """Test subscribing to conversion events when already subscribed."""
         # Mock event dispatcher
         mock_dispatcher = Mock()
@@ -399,7 +394,7 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         mock_dispatcher.observe_event.assert_not_called()
     
     @patch('carb.eventdispatcher.get_eventdispatcher')
-    async def test_shutdown_with_event_subscription(self, mock_get_dispatcher):
+    def test_shutdown_with_event_subscription(self, mock_get_dispatcher):
         """Test shutdown with active event subscription."""
         # Mock event dispatcher
         mock_dispatcher = Mock()
@@ -420,14 +415,14 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         
         self.assertIsNone(self.client_manager._conversion_subscription)
     
-    async def test_cleanup_completed_task(self):
+    def test_cleanup_completed_task(self):
         """Test cleaning up completed task resources."""
         # Create temp files
         temp_dir = tempfile.mkdtemp()
         glb_path = os.path.join(temp_dir, "test.glb")
         
         with open(glb_path, "wb") as f:
-            f.write(b"fake_glb_data")
+            f.write(_FAKE_GLB)
         
         # Set up mock task
         task_uid = "test-task-123"
@@ -454,24 +449,39 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
         self.assertFalse(os.path.exists(glb_path))
         self.assertFalse(os.path.exists(temp_dir))
     
-    async def test_polling_thread_starts(self):
-        """Test that polling thread starts on initialization."""
+    def test_polling_thread_starts(self):
+        """Test that the polling thread runs once started."""
+        self.client_manager._start_polling_thread()
+
         # Verify polling thread is running
         self.assertIsNotNone(self.client_manager._polling_thread)
         self.assertTrue(self.client_manager._polling_thread.is_alive())
         self.assertFalse(self.client_manager._stop_polling)
-    
-    async def test_polling_thread_stops_on_shutdown(self):
+
+    def test_polling_thread_survives_converting_task(self):
+        """A task parked for conversion must not kill the polling loop."""
+        task_info = self._make_task()
+        task_info.state = TaskState.CONVERTING
+        task_info.next_poll_at = float("inf")
+
+        self.client_manager._start_polling_thread()
+        # Wake the loop so it recomputes its sleep around the parked task;
+        # with an unclamped infinite deadline this raised OverflowError and
+        # killed the thread.
+        self.client_manager._wake.set()
+        time.sleep(0.2)
+
+        self.assertTrue(self.client_manager._polling_thread.is_alive())
+
+    def test_polling_thread_stops_on_shutdown(self):
         """Test that polling thread stops on shutdown."""
-        # Get reference to thread
+        self.client_manager._start_polling_thread()
         polling_thread = self.client_manager._polling_thread
         
-        # Shutdown
+        # Shutdown wakes the loop via the event and joins the thread, so no
+        # wall-clock sleep is needed before asserting.
         self.client_manager.shutdown()
-        
-        # Wait a bit for thread to stop
-        await asyncio.sleep(0.1)
-        
+
         # Verify thread stopped
         self.assertTrue(self.client_manager._stop_polling)
         self.assertFalse(polling_thread.is_alive())
@@ -480,7 +490,7 @@ class TestHunyuan3dClientManager(omni.kit.test.AsyncTestCase):
 class TestUsdConversionHandler(omni.kit.test.AsyncTestCase):
     """Test suite for USD conversion event handler."""
     
-    async def setUp(self):
+    def setUp(self):
         """Set up test fixtures."""
         self.temp_dir = tempfile.mkdtemp()
         self.glb_path = os.path.join(self.temp_dir, "test.glb")
@@ -489,50 +499,39 @@ class TestUsdConversionHandler(omni.kit.test.AsyncTestCase):
         
         # Create test GLB file
         with open(self.glb_path, "wb") as f:
-            f.write(b"fake_glb_data")
+            f.write(_FAKE_GLB)
     
-    async def tearDown(self):
+    def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir)
     
-    @patch('omni.kit.asset_converter.get_instance')
-    @patch('synctwin.hunyuan3d.core.client_manager.get_client_manager')
+    @patch('synctwin.hunyuan3d.core.client_manager._conversion_worker')
     @patch('asyncio.ensure_future')
-    async def test_handle_usd_conversion_request(self, mock_ensure_future, mock_get_client_manager, mock_get_converter):
+    def test_handle_usd_conversion_request(self, mock_ensure_future, mock_worker):
         """Test handling USD conversion request event."""
-        # Mock client manager
-        mock_client_manager = Mock()
-        mock_get_client_manager.return_value = mock_client_manager
-        
-        # Mock converter
-        mock_converter = Mock()
-        mock_task = Mock()
-        mock_get_converter.return_value = mock_converter
-        mock_converter.create_converter_task.return_value = mock_task
-        
         # Create event payload
         event = {
             "task_uid": self.task_uid,
             "glb_path": self.glb_path,
             "usd_path": self.usd_path
         }
-        
-        # Handle conversion request
-        _handle_usd_conversion_request(event)
-        
-        # Verify asyncio.ensure_future was called
-        mock_ensure_future.assert_called_once()
-        
-        # Get the coroutine that was passed to ensure_future
-        coro = mock_ensure_future.call_args[0][0]
-        self.assertTrue(asyncio.iscoroutine(coro))
-        
-        # Clean up the coroutine
-        coro.close()
+
+        # Force a fresh worker start; the patched worker returns a plain
+        # Mock, so no real coroutine frame is allocated and nothing needs
+        # closing afterwards.
+        with patch.object(client_manager_module, '_conversion_worker_future', None):
+            _handle_usd_conversion_request(event)
+
+            # Verify the request was queued for the worker
+            queued = client_manager_module._conversion_queue.get_nowait()
+            client_manager_module._conversion_queue.task_done()
+            self.assertEqual(queued, event)
+
+            # Verify the worker was started via asyncio.ensure_future
+            mock_ensure_future.assert_called_once_with(mock_worker.return_value)
     
-    async def test_handle_usd_conversion_request_missing_params(self):
+    def test_handle_usd_conversion_request_missing_params(self):
         """Test handling USD conversion request with missing parameters."""
         # Create incomplete event payload
         event = {
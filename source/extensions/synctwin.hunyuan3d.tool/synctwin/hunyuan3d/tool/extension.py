@@ -11,13 +11,17 @@
 import omni.ext
 import omni.ui as ui
 import os
-from omni.kit.window.file_importer import get_file_importer
+import threading
+import time
 import carb.settings
-from omni.kit.window.popup_dialog import FormDialog
 from synctwin.hunyuan3d.core import api_client
-import omni.kit.commands
-import omni.kit.asset_converter as converter
+import omni.kit.app
 import asyncio
+
+# omni.kit.asset_converter, omni.kit.commands and the file-importer/popup
+# dialog windows pull in substantial module trees; they are imported lazily
+# in the callbacks that need them so enabling the extension stays cheap.
+HUNYUAN3D_SETTINGS_ROOT = "/persistent/hunyuan3d"
 HUNYUAN3D_SETTINGS_HOST = "/persistent/hunyuan3d/host"
 HUNYUAN3D_SETTINGS_PORT = "/persistent/hunyuan3d/port"
 HUNYUAN3D_SETTINGS_REMOVE_BACKGROUND = "/persistent/hunyuan3d/remove_background"
@@ -31,6 +35,27 @@ HUNYUAN3D_SETTINGS_FACE_COUNT = "/persistent/hunyuan3d/face_count"
 
 GENERATE_BUTTON_TEXT = "Generate 3D"
 
+__all__ = ["Hunyuan3DExtension"]
+
+# Chatty diagnostics only print when HUNYUAN3D_DEBUG is set; passing the
+# values as separate arguments keeps release builds from even formatting
+# the message. Errors are always printed.
+_DEBUG = bool(os.environ.get("HUNYUAN3D_DEBUG"))
+
+
+def _dbg(*args):
+    """Print a debug message when HUNYUAN3D_DEBUG is set."""
+    if _DEBUG:
+        print(*args)
+
+# Resolved once at import: realpath stats every path component, so there is
+# no reason to redo it on each enable/disable cycle of the extension.
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+_DATA_DIR = os.path.normpath(os.path.join(_MODULE_DIR, "..", "..", "..", "data"))
+_EMPTY_ICON = f"{_DATA_DIR}/image_icon.svg"
+_IMAGE_ICON_WHITE = f"{_DATA_DIR}/image_icon_white.svg"
+_SETTINGS_ICON = f"{_DATA_DIR}/settings.svg"
+
 
 # Any class derived from `omni.ext.IExt` in the top level module (defined in
 # `python.modules` of `extension.toml`) will be instantiated when the extension
@@ -38,6 +63,45 @@ GENERATE_BUTTON_TEXT = "Generate 3D"
 # extension gets disabled on_shutdown() is called.
 class Hunyuan3DExtension(omni.ext.IExt):
     """This extension manages a simple counter UI."""
+
+    # Progress-message fragments mapped to button labels, scanned in order;
+    # built once instead of re-running an if/elif ladder per progress event.
+    _PROGRESS_RULES = (
+        ("Generation started", "Starting..."),
+        ("Status: processing", "Processing..."),
+        ("Status: texturing", "Texturing..."),
+        ("Status: converting", "Converting..."),
+        ("Converting GLB to USD", "Converting..."),
+    )
+
+    # Exact-match fast path for the common case where the progress message
+    # is one of the needles verbatim; falls back to the substring scan.
+    _PROGRESS_MAP = dict(_PROGRESS_RULES)
+
+    # Seconds a health probe result stays fresh before the label re-probes.
+    _HEALTH_TTL = 5.0
+
+    # Minimum seconds between progress log lines (caps logging at 10 Hz).
+    _LOG_INTERVAL = 0.1
+
+    # Static settings-dialog schema (field name, label, widget, state attr);
+    # only the default values depend on instance state, so the definitions
+    # are declared once instead of being rebuilt per dialog open.
+    _FIELD_SCHEMA = (
+        # Connection settings
+        ("host", "Host:", ui.StringField, "_service_host"),
+        ("port", "Port:", ui.IntField, "_service_port"),
+        # Generation parameters
+        ("remove_background", "Remove Background:", ui.CheckBox, "_remove_background"),
+        ("texture", "Generate Texture:", ui.CheckBox, "_texture"),
+        ("seed", "Seed:", ui.IntField, "_seed"),
+        ("octree_resolution", "Octree Resolution:", ui.IntField, "_octree_resolution"),
+        ("num_inference_steps", "Inference Steps:", ui.IntField, "_num_inference_steps"),
+        ("guidance_scale", "Guidance Scale:", ui.FloatField, "_guidance_scale"),
+        ("num_chunks", "Number of Chunks:", ui.IntField, "_num_chunks"),
+        ("face_count", "Face Count:", ui.IntField, "_face_count"),
+    )
+
     # ext_id is the current extension id. It can be used with the extension
     # manager to query additional information, like where this extension is
     # located on the filesystem.
@@ -45,44 +109,37 @@ class Hunyuan3DExtension(omni.ext.IExt):
         """This is called every time the extension is activated."""
         print("[synctwin.hunyuan3d.tool] Extension startup")
 
-        self._data_dir = os.path.dirname(os.path.realpath(__file__))+"/../../../data"
+        self._data_dir = _DATA_DIR
         self._image_path = None
         settings = carb.settings.get_settings()
 
-        # Load connection settings
-        self._service_host = settings.get_as_string(HUNYUAN3D_SETTINGS_HOST)
-        if self._service_host == "":
-            self._service_host = "localhost"
-        self._service_port = settings.get_as_int(HUNYUAN3D_SETTINGS_PORT)
-        if self._service_port == 0:
-            self._service_port = 8081
-
-        # Load generation parameters with defaults
-        remove_bg_setting = settings.get_as_bool(HUNYUAN3D_SETTINGS_REMOVE_BACKGROUND)
-        self._remove_background = remove_bg_setting if remove_bg_setting is not None else True
-
-        texture_setting = settings.get_as_bool(HUNYUAN3D_SETTINGS_TEXTURE)
-        self._texture = texture_setting if texture_setting is not None else True
-        self._seed = settings.get_as_int(HUNYUAN3D_SETTINGS_SEED)
-        if self._seed == 0:
-            self._seed = 1234
-        self._octree_resolution = settings.get_as_int(HUNYUAN3D_SETTINGS_OCTREE_RESOLUTION)
-        if self._octree_resolution == 0:
-            self._octree_resolution = 256
-        self._num_inference_steps = settings.get_as_int(HUNYUAN3D_SETTINGS_NUM_INFERENCE_STEPS)
-        if self._num_inference_steps == 0:
-            self._num_inference_steps = 5
-        self._guidance_scale = settings.get_as_float(HUNYUAN3D_SETTINGS_GUIDANCE_SCALE)
-        if self._guidance_scale == 0.0:
-            self._guidance_scale = 5.0
-        self._num_chunks = settings.get_as_int(HUNYUAN3D_SETTINGS_NUM_CHUNKS)
-        if self._num_chunks == 0:
-            self._num_chunks = 8000
-        self._face_count = settings.get_as_int(HUNYUAN3D_SETTINGS_FACE_COUNT)
-        if self._face_count == 0:
-            self._face_count = 40000
-
-        self._empty_image_path = f"{self._data_dir}/image_icon.svg"
+        # Load all persisted settings with one subtree fetch instead of ten
+        # per-key crossings into carb; unset/zero values fall back to the
+        # defaults, matching the old per-key behavior.
+        root = settings.get(HUNYUAN3D_SETTINGS_ROOT) or {}
+        self._service_host = root.get("host") or "localhost"
+        self._service_port = root.get("port") or 8081
+        self._remove_background = root.get("remove_background", True)
+        self._texture = root.get("texture", True)
+        self._seed = root.get("seed") or 1234
+        self._octree_resolution = root.get("octree_resolution") or 256
+        self._num_inference_steps = root.get("num_inference_steps") or 5
+        self._guidance_scale = root.get("guidance_scale") or 5.0
+        self._num_chunks = root.get("num_chunks") or 8000
+        self._face_count = root.get("face_count") or 40000
+
+        self._empty_image_path = _EMPTY_ICON
+
+        # Persistent API client reused for every health check; a background
+        # ping warms its keep-alive pool so the first Generate click does not
+        # pay the TCP handshake on the UI thread.
+        self._healthy = False
+        self._health_checked_at = -self._HEALTH_TTL
+        self._base_url_cached = f"http://{self._service_host}:{self._service_port}"
+        self._host_label_text = f"Host: {self._service_host}:{self._service_port}"
+        self._client = api_client.Hunyuan3DAPIClient(self._base_url)
+        threading.Thread(target=self._ping_service, daemon=True).start()
+
         self._window = ui.Window(
             "Hunyuan3D 2.1 Image To 3D", width=400, height=360
         )
@@ -96,9 +153,9 @@ class Hunyuan3DExtension(omni.ext.IExt):
                     ui.Spacer()
                 with ui.HStack():
                     self.generate_button = ui.Button(GENERATE_BUTTON_TEXT, clicked_fn=self.on_generate_3d_clicked,height=40)
-                    ui.Button(image_url=f"{self._data_dir}/image_icon_white.svg", clicked_fn=self.on_select_image_clicked,height=40, width=40)
+                    ui.Button(image_url=_IMAGE_ICON_WHITE, clicked_fn=self.on_select_image_clicked,height=40, width=40)
                     # we dont have anything to configure yet
-                    ui.Button(image_url=f"{self._data_dir}/settings.svg", clicked_fn=self.on_configure_clicked,
+                    ui.Button(image_url=_SETTINGS_ICON, clicked_fn=self.on_configure_clicked,
                               height=40, width=40, tooltip="configure", enabled=True, visible=True)
                 with ui.HStack():
                     #self.health_image = ui.Image(width=25, height=25, alignment=ui.Alignment.CENTER)
@@ -108,40 +165,113 @@ class Hunyuan3DExtension(omni.ext.IExt):
 
 
         self._uid = None
+        self._preview_source = None
+        self._last_button_state = None
+        self._last_log_ts = 0.0
+        self._pending_open = None
+        self._settings_dialog = None
+
+        # Progress callbacks arrive on worker threads; they stash the next
+        # button label here and the per-frame subscription below applies it
+        # on the UI thread, coalescing bursts into one write per frame.
+        self._pending_btn_text = None
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(
+                self._on_update, name="synctwin.hunyuan3d.tool.ui_pump"
+            )
+        )
         self.update_image()
         self.update_host_info()
 
     @property
     def _base_url(self):
-        return f"http://{self._service_host}:{self._service_port}"
+        # Rebuilt only when connection settings change, not per access
+        return self._base_url_cached
+
+    def _ping_service(self):
+        """Warm the connection pool; offline is fine, the label shows it."""
+        self._is_service_healthy()
+
+    def _is_service_healthy(self) -> bool:
+        """Health check through the persistent client's pooled connection."""
+        try:
+            healthy = self._client.health_check().status == "healthy"
+        except Exception:
+            healthy = False
+        self._healthy = healthy
+        self._health_checked_at = time.monotonic()
+        return healthy
+
+    async def _async_update_host_info(self):
+        """Probe service health off the UI thread, then update the label."""
+        healthy = await asyncio.get_event_loop().run_in_executor(
+            None, self._is_service_healthy
+        )
+        self._set_health_label(healthy)
 
     def update_host_info(self):
-        health_status = "(Online)" if api_client.is_healthy(base_url=self._base_url) else "(Offline)"
-        self.health_label.text = health_status
-        self.host_label.text = f"Host: {self._service_host}:{self._service_port}"
+        # Label text is rebuilt only when settings change; skip the widget
+        # write entirely when it is already showing the right host
+        if self.host_label.text != self._host_label_text:
+            self.host_label.text = self._host_label_text
+        # Serve a recent probe result immediately; only re-probe (in a worker
+        # thread, never blocking the UI) once the cached result has aged out.
+        if time.monotonic() - self._health_checked_at < self._HEALTH_TTL:
+            self._set_health_label(self._healthy)
+            return
+        asyncio.ensure_future(self._async_update_host_info())
+
+    def _set_health_label(self, healthy: bool):
+        # Skip the widget write when the label already shows this state
+        text = "(Online)" if healthy else "(Offline)"
+        if self.health_label.text != text:
+            self.health_label.text = text
+
+    def _should_log_progress(self) -> bool:
+        """Gate for progress logging; formatting and stdout writes add up
+        when conversion callbacks fire many times per second."""
+        now = time.monotonic()
+        if now - self._last_log_ts < self._LOG_INTERVAL:
+            return False
+        self._last_log_ts = now
+        return True
 
     def progress_callback(self, progress: float):
-        print(f"convert progress: {progress}")
+        if self._should_log_progress():
+            _dbg("convert progress:", progress)
+
+    def _on_update(self, _event):
+        """Apply the latest pending button label on the UI thread."""
+        text = self._pending_btn_text
+        if text is not None:
+            self._pending_btn_text = None
+            if self.generate_button.text != text:
+                self.generate_button.text = text
 
     def on_progress_update(self, message: str):
-        print(f"generation progress: {message}")
-
-        # Update button text based on progress message
-        if "Generation started" in message:
-            self.generate_button.text = "Starting..."
-        elif "Status: processing" in message:
-            self.generate_button.text = "Processing..."
-        elif "Status: texturing" in message:
-            self.generate_button.text = "Texturing..."
-        elif "Status: converting" in message or "Converting GLB to USD" in message:
-            self.generate_button.text = "Converting..."
-        elif "downloading" in message.lower():
-            self.generate_button.text = "Downloading..."
-        else:
-            # For any other status, show "generating..."
-            self.generate_button.text = "Generating..."
+        if self._should_log_progress():
+            _dbg("generation progress:", message)
+
+        # Resolve the button text for this progress message; the actual
+        # widget write happens in _on_update on the UI thread
+        label = self._PROGRESS_MAP.get(message)
+        if label is None:
+            for needle, label in self._PROGRESS_RULES:
+                if needle in message:
+                    break
+            else:
+                if "downloading" in message.lower():
+                    label = "Downloading..."
+                else:
+                    # For any other status, show "generating..."
+                    label = "Generating..."
+        self._pending_btn_text = label
 
     async def convert(self, input_asset_path, output_asset_path):
+        import omni.kit.asset_converter as converter
+
         task_manager = converter.get_instance()
         task = task_manager.create_converter_task(input_asset_path, output_asset_path, self.progress_callback)
         success = await task.wait_until_finished()
@@ -151,22 +281,29 @@ class Hunyuan3DExtension(omni.ext.IExt):
             detailed_status_error_string = task.get_error_message()
             print(f"Failed to convert asset: {detailed_status_error_string} {detailed_status_code}")
             return False
-        print(f"Asset converted successfully: {output_asset_path}")
+        _dbg("Asset converted successfully:", output_asset_path)
         return True
 
     def on_task_completed(self, task_uid: str, success: bool, path_or_error: str):
         """Callback for when a task completes."""
-        print(f"Task {task_uid} completed: success={success}, result={path_or_error}")
+        _dbg("Task", task_uid, "completed: success =", success, "result =", path_or_error)
 
-        # Reset UI state
+        # Reset UI state (drop any progress label still waiting for a frame)
+        self._pending_btn_text = None
         self.generate_button.text = GENERATE_BUTTON_TEXT
         self.generate_button.enabled = True
         self._uid = None
 
         if success:
-            # USD file was created successfully, optionally load it
+            # USD file was created successfully, optionally load it; keep
+            # the future so shutdown can cancel a stage-open in flight
             try:
-                asyncio.ensure_future(omni.usd.get_context().open_stage_async(path_or_error))
+                self._pending_open = asyncio.ensure_future(
+                    omni.usd.get_context().open_stage_async(path_or_error)
+                )
+                self._pending_open.add_done_callback(
+                    lambda _f: setattr(self, "_pending_open", None)
+                )
             except Exception as e:
                 print(f"Failed to open USD stage: {e}")
         else:
@@ -177,14 +314,15 @@ class Hunyuan3DExtension(omni.ext.IExt):
                               dirname: str,
                               extension: str = "",
                               selections: list = []):
-        print(f"> open '{filename}{extension}' from '{dirname}' with additional selections '{selections}'")
-        if not dirname.endswith("/"):
-            dirname += "/"
-        filepath = f"{dirname}{filename}{extension}"
-        self._image_path = filepath
+        _dbg("> open", filename, extension, "from", dirname, "with additional selections", selections)
+        # normpath keeps separators consistent so repeat loads of the same
+        # file hit omni.ui's texture cache
+        self._image_path = os.path.normpath(os.path.join(dirname, filename + extension))
         self.update_image()
 
     def on_select_image_clicked(self):
+        from omni.kit.window.file_importer import get_file_importer
+
         file_importer = get_file_importer()
         if not file_importer:
             return
@@ -198,29 +336,47 @@ class Hunyuan3DExtension(omni.ext.IExt):
                                   ("*.jpeg", "JPEG files")],
             file_extension="png")
 
+    def _set_preview_source(self, source_url):
+        """
+        Update the preview image only when the source actually changed.
+
+        omni.ui.Image re-reads, re-decodes and re-uploads the texture on
+        every source_url assignment, even for an identical path, so repeat
+        update_image calls (e.g. after settings toggles) skip the write.
+        """
+        if source_url != self._preview_source:
+            self._preview_source = source_url
+            self.image_preview.source_url = source_url
+
     def update_image(self):
-        print("update image", self._image_path)
+        _dbg("update image", self._image_path)
         if self._image_path is None:
-            self.image_preview.source_url = self._empty_image_path
-            self.generate_button.enabled = False
-            self.generate_button.tooltip = "Select an image to generate a 3D model"
+            source = self._empty_image_path
+            button_state = (False, "Select an image to generate a 3D model")
         else:
-            self.image_preview.source_url = self._image_path
-            self.generate_button.enabled = True
-            self.generate_button.tooltip = "Generate 3D model"
+            source = self._image_path
+            button_state = (True, "Generate 3D model")
+
+        self._set_preview_source(source)
+        # Widget writes trigger re-layout even when the value is identical,
+        # so only touch the button when its state actually changed
+        if button_state != self._last_button_state:
+            self._last_button_state = button_state
+            self.generate_button.enabled, self.generate_button.tooltip = button_state
 
     def on_generate_3d_clicked(self):
-        print("generate 3d clicked")
+        _dbg("generate 3d clicked")
         if self._image_path is None:
-            print("no image selected")
+            _dbg("no image selected")
             return
         if self._uid is None:
+            import omni.kit.commands
             try:
                 # Execute the Hunyuan3D command
                 success, result = omni.kit.commands.execute(
                     "Hunyuan3dImageTo3d",
                     image_path=self._image_path,
-                    base_url=f"http://{self._service_host}:{self._service_port}",
+                    base_url=self._base_url,
                     remove_background=self._remove_background,
                     texture=self._texture,
                     seed=self._seed,
@@ -237,17 +393,19 @@ class Hunyuan3DExtension(omni.ext.IExt):
                     self._uid = result.get("task_uid")
                     self.generate_button.enabled = False
                     self.generate_button.text = "generating..."
-                    print(f"started generating 3d model with uid {self._uid}")
+                    _dbg("started generating 3d model with uid", self._uid)
                 else:
                     print("Failed to start generation")
 
             except Exception as e:
                 print(f"Command execution failed: {e}")
         else:
-            print(f"already generating 3d model with uid {self._uid}")
+            _dbg("already generating 3d model with uid", self._uid)
 
-    def _on_settings_ok(self, dialog: FormDialog):
+    def _on_settings_ok(self, dialog):
         values = dialog.get_values()
+        host_changed = (values["host"] != self._service_host
+                        or values["port"] != self._service_port)
 
         # Update connection settings
         self._service_host = values["host"]
@@ -263,40 +421,43 @@ class Hunyuan3DExtension(omni.ext.IExt):
         self._num_chunks = values["num_chunks"]
         self._face_count = values["face_count"]
 
-        # Save to persistent settings
+        # Save to persistent settings; a single subtree write notifies
+        # subscribers and flushes the persistent store once instead of
+        # once per key
         settings = carb.settings.get_settings()
-        settings.set(HUNYUAN3D_SETTINGS_HOST, self._service_host)
-        settings.set(HUNYUAN3D_SETTINGS_PORT, self._service_port)
-        settings.set(HUNYUAN3D_SETTINGS_REMOVE_BACKGROUND, self._remove_background)
-        settings.set(HUNYUAN3D_SETTINGS_TEXTURE, self._texture)
-        settings.set(HUNYUAN3D_SETTINGS_SEED, self._seed)
-        settings.set(HUNYUAN3D_SETTINGS_OCTREE_RESOLUTION, self._octree_resolution)
-        settings.set(HUNYUAN3D_SETTINGS_NUM_INFERENCE_STEPS, self._num_inference_steps)
-        settings.set(HUNYUAN3D_SETTINGS_GUIDANCE_SCALE, self._guidance_scale)
-        settings.set(HUNYUAN3D_SETTINGS_NUM_CHUNKS, self._num_chunks)
-        settings.set(HUNYUAN3D_SETTINGS_FACE_COUNT, self._face_count)
-
-        self.update_host_info()
+        settings.set(HUNYUAN3D_SETTINGS_ROOT, {
+            "host": self._service_host,
+            "port": self._service_port,
+            "remove_background": self._remove_background,
+            "texture": self._texture,
+            "seed": self._seed,
+            "octree_resolution": self._octree_resolution,
+            "num_inference_steps": self._num_inference_steps,
+            "guidance_scale": self._guidance_scale,
+            "num_chunks": self._num_chunks,
+            "face_count": self._face_count,
+        })
+
+        if host_changed:
+            # Rebuild the cached URL, swap the persistent client and
+            # invalidate the cached health probe
+            self._base_url_cached = f"http://{self._service_host}:{self._service_port}"
+            self._host_label_text = f"Host: {self._service_host}:{self._service_port}"
+            self._client.close()
+            self._client = api_client.Hunyuan3DAPIClient(self._base_url)
+            self._health_checked_at = -self._HEALTH_TTL
+            self.update_host_info()
         dialog.hide()
 
     # build the dialog just by adding field_defs
-    def _build_settings_dialog(self) -> FormDialog:
-        print(f"Building settings dialog with remove_background={self._remove_background}, texture={self._texture}")
+    def _build_settings_dialog(self):
+        from omni.kit.window.popup_dialog import FormDialog
+
+        _dbg("Building settings dialog; remove_background:", self._remove_background, "texture:", self._texture)
 
         field_defs = [
-            # Connection settings
-            FormDialog.FieldDef("host", "Host:", ui.StringField, self._service_host),
-            FormDialog.FieldDef("port", "Port:", ui.IntField, self._service_port),
-
-            # Generation parameters
-            FormDialog.FieldDef("remove_background", "Remove Background:", ui.CheckBox, self._remove_background),
-            FormDialog.FieldDef("texture", "Generate Texture:", ui.CheckBox, self._texture),
-            FormDialog.FieldDef("seed", "Seed:", ui.IntField, self._seed),
-            FormDialog.FieldDef("octree_resolution", "Octree Resolution:", ui.IntField, self._octree_resolution),
-            FormDialog.FieldDef("num_inference_steps", "Inference Steps:", ui.IntField, self._num_inference_steps),
-            FormDialog.FieldDef("guidance_scale", "Guidance Scale:", ui.FloatField, self._guidance_scale),
-            FormDialog.FieldDef("num_chunks", "Number of Chunks:", ui.IntField, self._num_chunks),
-            FormDialog.FieldDef("face_count", "Face Count:", ui.IntField, self._face_count),
+            FormDialog.FieldDef(name, label, widget, getattr(self, attr))
+            for name, label, widget, attr in self._FIELD_SCHEMA
         ]
         dialog = FormDialog(
             title="Hunyuan3D Settings",
@@ -307,8 +468,16 @@ class Hunyuan3DExtension(omni.ext.IExt):
         return dialog
 
     def on_configure_clicked(self):
-        dlg = self._build_settings_dialog()
-        dlg.show()
+        # Build the dialog once and reuse it; on reopen just refresh the
+        # field values from current state instead of rebuilding 10 widgets
+        if self._settings_dialog is None:
+            self._settings_dialog = self._build_settings_dialog()
+        else:
+            for name, _label, _widget, attr in self._FIELD_SCHEMA:
+                field = self._settings_dialog.get_field(name)
+                if field is not None:
+                    field.model.set_value(getattr(self, attr))
+        self._settings_dialog.show()
 
 
     def on_shutdown(self):
@@ -318,7 +487,17 @@ class Hunyuan3DExtension(omni.ext.IExt):
 
         # Cancel any running task
         if self._uid:
+            import omni.kit.commands
             try:
                 omni.kit.commands.execute("Undo")
             except Exception as e:
                 print(f"Failed to cancel task on shutdown: {e}")
+
+        if self._pending_open and not self._pending_open.done():
+            self._pending_open.cancel()
+        self._pending_open = None
+        if self._settings_dialog is not None:
+            self._settings_dialog.hide()
+            self._settings_dialog = None
+        self._update_sub = None
+        self._client.close()